@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import logging
+import os
+
 from beer_garden.__version__ import __version__
 
 __all__ = ["__version__", "application"]
@@ -8,4 +11,12 @@ application = None
 
 
 def signal_handler(_signal_number, _stack_frame):
+    # A second signal means a graceful shutdown is already underway and is not going
+    # fast enough for whoever sent it, so stop waiting on it
+    if application.stopped():
+        logging.getLogger(__name__).warning(
+            "Received another shutdown signal, exiting without a clean shutdown"
+        )
+        os._exit(1)
+
     application.stop()
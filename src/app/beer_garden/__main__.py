@@ -11,6 +11,9 @@ import beer_garden.config
 import beer_garden.log
 from beer_garden.app import Application
 
+# Seconds to wait on the application thread between checks during shutdown
+SHUTDOWN_JOIN_INTERVAL = 1
+
 
 def generate_config():
     beer_garden.config.generate(sys.argv[1:])
@@ -68,8 +71,10 @@ def main():
     # Thanks! :)
     signal.pause()
 
-    if beer_garden.application.is_alive():
-        beer_garden.application.join()
+    # Join in short intervals so that the main thread gets back to the interpreter
+    # regularly and a second signal can still force an exit if the shutdown hangs
+    while beer_garden.application.is_alive():
+        beer_garden.application.join(timeout=SHUTDOWN_JOIN_INTERVAL)
 
     logger.info("OK, we're all shut down. Have a good night!\n")
 
@@ -47,6 +47,7 @@ import beer_garden.events
 import beer_garden.log
 import beer_garden.requests
 import beer_garden.router
+import beer_garden.user
 from beer_garden.api.http.client import SerializeHelper
 from beer_garden.api.http.processors import EventManager, websocket_publish
 from beer_garden.api.http.schemas.v1.command_publishing_blocklist import (
@@ -252,6 +253,11 @@ async def shutdown():
     logger.debug("Closing all open HTTP connections")
     await server.close_all_connections()
 
+    # User updates made by this process are published after a short delay, make sure
+    # any still waiting go out before the process exits
+    logger.debug("Publishing pending user events")
+    beer_garden.user.flush_user_events()
+
     logger.debug("Stopping IO loop")
     io_loop.add_callback(io_loop.stop)
 
@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
+import json
+import time
+from typing import Dict, Optional, Tuple
+
 from brewtils.errors import ModelValidationError, NotFoundError
-from brewtils.models import Operation
+from brewtils.models import Operation, PatchOperation
 from brewtils.schema_parser import SchemaParser
 from brewtils.schemas import JobExportInputSchema, JobSchema
 from mongoengine.errors import ValidationError
 
 from beer_garden.api.authorization import Permissions
-from beer_garden.api.http.exceptions import BadRequest
+from beer_garden.api.http.exceptions import BadRequest, NotFound
 from beer_garden.api.http.handlers import AuthorizationHandler
 from beer_garden.db.mongo.models import Job
 from beer_garden.scheduler import create_jobs
@@ -16,6 +20,94 @@ JOB_READ = Permissions.JOB_READ.value
 JOB_UPDATE = Permissions.JOB_UPDATE.value
 JOB_DELETE = Permissions.JOB_DELETE.value
 
+# Number of jobs written to the job list response between flushes
+JOB_LIST_FLUSH_SIZE = 100
+
+# Serialized job list responses are kept for a short time, keyed by the request's
+# permission filter and query parameters, so that clients polling the job list do not
+# each cause a query and serialization. Changes made through this API invalidate the
+# cache, other changes (scheduled runs, for example) show up once an entry expires.
+# Responses with more than JOB_LIST_CACHE_MAX_JOBS jobs are streamed without caching.
+JOB_LIST_CACHE_TTL = 2
+JOB_LIST_CACHE_SIZE = 128
+JOB_LIST_CACHE_MAX_JOBS = 1000
+_job_list_cache: Dict[tuple, Tuple[float, str]] = {}
+
+# Incremented on every change made through this API. It is part of the cache key, so a
+# response built from a query that started before a change is never served after it.
+_job_list_generation = 0
+
+# Operation used to move a job into each status supported by a status patch
+JOB_STATUS_OPERATIONS = {"PAUSED": "JOB_PAUSE", "RUNNING": "JOB_RESUME"}
+
+
+def _get_cached_job_list(key: tuple) -> Optional[str]:
+    """Get a cached job list response, if there is one that has not expired"""
+    entry = _job_list_cache.get(key)
+
+    if entry is None:
+        return None
+
+    expires_at, body = entry
+    if expires_at <= time.monotonic():
+        _job_list_cache.pop(key, None)
+        return None
+
+    return body
+
+
+def _job_list_cache_key(q_filter, filter_params: dict) -> tuple:
+    """Build the cache key for a job list request, using the current generation"""
+    return (
+        _job_list_generation,
+        repr(q_filter.to_query(Job)),
+        tuple(sorted(filter_params.items())),
+    )
+
+
+def _cache_job_list(key: tuple, body: str) -> None:
+    """Cache a job list response, evicting the oldest entry if the cache is full"""
+    # Jobs were changed while this response was being built, so it may be stale
+    if key[0] != _job_list_generation:
+        return
+
+    if key not in _job_list_cache and len(_job_list_cache) >= JOB_LIST_CACHE_SIZE:
+        _job_list_cache.pop(next(iter(_job_list_cache)))
+
+    _job_list_cache[key] = (time.monotonic() + JOB_LIST_CACHE_TTL, body)
+
+
+def _clear_job_list_cache() -> None:
+    """Drop all cached job list responses. Called whenever a job is changed"""
+    global _job_list_generation
+
+    _job_list_generation += 1
+    _job_list_cache.clear()
+
+
+def _parse_patch(body):
+    """Parse a job patch body into a list of PatchOperations
+
+    The patch schema only has three loosely typed fields, so the operations are built
+    directly rather than going through the marshmallow schema. The same envelope formats
+    as ``SchemaParser.parse_patch`` are accepted: a single operation, a list of
+    operations, or a dictionary with an ``operations`` list.
+    """
+    data = json.loads(body)
+
+    if isinstance(data, dict):
+        data = data["operations"] if "operations" in data else [data]
+
+    if not isinstance(data, list) or not all(isinstance(op, dict) for op in data):
+        raise ModelValidationError("Patch must be an operation or list of operations")
+
+    return [
+        PatchOperation(
+            operation=op.get("operation"), path=op.get("path"), value=op.get("value")
+        )
+        for op in data
+    ]
+
 
 class JobAPI(AuthorizationHandler):
     async def get(self, job_id):
@@ -40,14 +132,21 @@ class JobAPI(AuthorizationHandler):
         tags:
           - Jobs
         """
-        _ = self.get_or_raise(Job, JOB_READ, id=job_id)
+        try:
+            job = await self.client(
+                Operation(operation_type="JOB_READ", args=[job_id]),
+                serialize_kwargs={"return_raw": True},
+            )
+        except ValidationError:
+            raise NotFound
 
-        response = await self.client(
-            Operation(operation_type="JOB_READ", args=[job_id])
-        )
+        if job is None:
+            raise NotFound
+
+        self.verify_user_permission_for_object(JOB_READ, job)
 
         self.set_header("Content-Type", "application/json; charset=UTF-8")
-        self.write(response)
+        self.write(SchemaParser.serialize(job, to_string=True))
 
     async def patch(self, job_id):
         """
@@ -96,25 +195,22 @@ class JobAPI(AuthorizationHandler):
         """
         _ = self.get_or_raise(Job, JOB_UPDATE, id=job_id)
 
-        patch = SchemaParser.parse_patch(self.request.decoded_body, from_string=True)
-
-        for op in patch:
+        operations = []
+        for op in _parse_patch(self.request.decoded_body):
             if op.operation == "update":
                 if op.path == "/status":
-                    if str(op.value).upper() == "PAUSED":
-                        response = await self.client(
-                            Operation(operation_type="JOB_PAUSE", args=[job_id])
-                        )
-                    elif str(op.value).upper() == "RUNNING":
-                        response = await self.client(
-                            Operation(operation_type="JOB_RESUME", args=[job_id])
-                        )
-                    else:
+                    operation_type = JOB_STATUS_OPERATIONS.get(str(op.value).upper())
+
+                    if operation_type is None:
                         raise ModelValidationError(
                             f"Unsupported status value '{op.value}'"
                         )
+
+                    operations.append(
+                        Operation(operation_type=operation_type, args=[job_id])
+                    )
                 elif op.path == "/job":
-                    response = await self.client(
+                    operations.append(
                         Operation(
                             operation_type="JOB_UPDATE",
                             args=[SchemaParser.parse_job(op.value)],
@@ -125,6 +221,19 @@ class JobAPI(AuthorizationHandler):
             else:
                 raise ModelValidationError(f"Unsupported operation '{op.operation}'")
 
+        if not operations:
+            raise ModelValidationError("No patch operations provided")
+
+        # Operations all act on the same job so they must be applied in order. Only
+        # the result of the last one is returned, so skip serializing the others.
+        try:
+            for operation in operations[:-1]:
+                await self.client(operation, serialize_kwargs={"return_raw": True})
+
+            response = await self.client(operations[-1])
+        finally:
+            _clear_job_list_cache()
+
         self.set_header("Content-Type", "application/json; charset=UTF-8")
         self.write(response)
 
@@ -151,12 +260,17 @@ class JobAPI(AuthorizationHandler):
         """
         _ = self.get_or_raise(Job, JOB_DELETE, id=job_id)
 
-        await self.client(Operation(operation_type="JOB_DELETE", args=[job_id]))
+        try:
+            await self.client(Operation(operation_type="JOB_DELETE", args=[job_id]))
+        finally:
+            _clear_job_list_cache()
 
         self.set_status(204)
 
 
 class JobListAPI(AuthorizationHandler):
+    REQUEST_FIELDS = frozenset(JobSchema.get_attribute_names())
+
     async def get(self):
         """
         ---
@@ -175,23 +289,56 @@ class JobListAPI(AuthorizationHandler):
         """
         permitted_objects_filter = self.permitted_objects_filter(Job, JOB_READ)
 
-        filter_params = {}
-        for key in self.request.arguments.keys():
-            if key in JobSchema.get_attribute_names():
-                filter_params[key] = self.get_query_argument(key)
+        filter_params = {
+            key: self.get_query_argument(key)
+            for key in self.request.arguments.keys()
+            if key in self.REQUEST_FIELDS
+        }
+
+        cache_key = _job_list_cache_key(permitted_objects_filter, filter_params)
+
+        self.set_header("Content-Type", "application/json; charset=UTF-8")
+
+        cached_response = _get_cached_job_list(cache_key)
+        if cached_response is not None:
+            self.write(cached_response)
+            return
 
-        response = await self.client(
+        jobs = await self.client(
             Operation(
                 operation_type="JOB_READ_ALL",
                 kwargs={
                     "q_filter": permitted_objects_filter,
                     "filter_params": filter_params,
                 },
-            )
+            ),
+            serialize_kwargs={"return_raw": True},
         )
 
-        self.set_header("Content-Type", "application/json; charset=UTF-8")
-        self.write(response)
+        # Serialize and write one job at a time rather than building the entire
+        # response before writing it, flushing periodically so the response is streamed.
+        # The response is only kept in memory if it is small enough to be cached.
+        parts = ["["] if len(jobs) <= JOB_LIST_CACHE_MAX_JOBS else None
+        self.write("[")
+
+        for index, job in enumerate(jobs):
+            serialized_job = SchemaParser.serialize_job(job, to_string=True)
+
+            if index:
+                serialized_job = "," + serialized_job
+
+            if parts is not None:
+                parts.append(serialized_job)
+            self.write(serialized_job)
+
+            if (index + 1) % JOB_LIST_FLUSH_SIZE == 0:
+                await self.flush()
+
+        self.write("]")
+
+        if parts is not None:
+            parts.append("]")
+            _cache_job_list(cache_key, "".join(parts))
 
     async def post(self):
         """
@@ -224,12 +371,15 @@ class JobListAPI(AuthorizationHandler):
 
         self.verify_user_permission_for_object(JOB_CREATE, job)
 
-        response = await self.client(
-            Operation(
-                operation_type="JOB_CREATE",
-                args=[job],
+        try:
+            response = await self.client(
+                Operation(
+                    operation_type="JOB_CREATE",
+                    args=[job],
+                )
             )
-        )
+        finally:
+            _clear_job_list_cache()
 
         self.set_status(201)
         self.set_header("Content-Type", "application/json; charset=UTF-8")
@@ -269,7 +419,10 @@ class JobImportAPI(AuthorizationHandler):
         for job in parsed_job_list:
             self.verify_user_permission_for_object(JOB_CREATE, job)
 
-        create_jobs_output = create_jobs(parsed_job_list)
+        try:
+            create_jobs_output = create_jobs(parsed_job_list)
+        finally:
+            _clear_job_list_cache()
         created_jobs = create_jobs_output["created"]
 
         response = {"ids": [job.id for job in created_jobs]}
@@ -380,6 +533,8 @@ class JobExecutionAPI(AuthorizationHandler):
             raise NotFoundError
         except ModelValidationError as exc:
             raise BadRequest(reason=f"{exc}")
+        finally:
+            _clear_job_list_cache()
 
         self.set_status(202)
         self.set_header("Content-Type", "application/json; charset=UTF-8")
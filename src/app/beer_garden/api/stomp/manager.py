@@ -38,6 +38,8 @@ class StompManager(BaseProcessor):
             ssl=stomp_config.get("ssl"),
             username=stomp_config.get("username"),
             password=stomp_config.get("password"),
+            batch_size=stomp_config.get("batch_size"),
+            flush_interval=stomp_config.get("flush_interval"),
         )
 
         if conn.connect():
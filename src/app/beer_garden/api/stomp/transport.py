@@ -1,7 +1,12 @@
 import logging
+import queue
+import threading
+import time
+from itertools import groupby
+from operator import itemgetter
 from random import choice
 from string import ascii_letters
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import certifi
 import stomp
@@ -13,6 +18,11 @@ import beer_garden.router
 
 logger = logging.getLogger(__name__)
 
+# Used when a connection is created without batching settings (child garden
+# connections, for example). These match the configuration defaults.
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_FLUSH_INTERVAL = 0.005
+
 
 def consolidate_headers(*args) -> dict:
     """Consolidates header dictionaries into one dict
@@ -81,29 +91,38 @@ def parse_header_list(headers: str) -> Dict[str, str]:
     return tmp_headers
 
 
-def send(
+def prepare(
     body: Any,
     garden_headers: dict = None,
-    conn: stomp.Connection = None,
     send_destination: str = None,
     request_headers: dict = None,
-):
+) -> Tuple[str, dict, Optional[str]]:
+    """Build the frame that should be sent for a message body
+
+    Args:
+        body: the message body to send
+        garden_headers: Headers configured for the garden connection
+        send_destination: The default destination for the frame
+        request_headers: Headers of the message being replied to, if any
+
+    Returns:
+        Tuple of the serialized message, headers dict, and destination
+
+    """
     message, model_headers = process(body)
 
     headers = consolidate_headers(request_headers, model_headers, garden_headers)
 
-    if conn.is_connected() and send_destination:
-        destination = send_destination
-        if request_headers and "reply-to" in request_headers:
-            destination = request_headers["reply-to"]
+    destination = send_destination
+    if send_destination and request_headers and "reply-to" in request_headers:
+        destination = request_headers["reply-to"]
 
-        conn.send(body=message, headers=headers, destination=destination)
+    return message, headers, destination
 
 
 class OperationListener(stomp.ConnectionListener):
-    def __init__(self, conn=None, send_destination=None):
+    def __init__(self, conn: "Connection" = None):
         self.conn = conn
-        self.send_destination = send_destination
 
     def on_error(self, headers, message):
         logger.warning(f"Error:\n\tMessage: {message}\n\tHeaders: {headers}")
@@ -139,25 +158,39 @@ class OperationListener(stomp.ConnectionListener):
                 result = beer_garden.router.route(operation)
 
                 if result:
-                    send(
-                        result,
-                        request_headers=headers,
-                        conn=self.conn,
-                        send_destination=self.send_destination,
-                    )
+                    self.conn.send(result, request_headers=headers)
         except Exception as e:
             logger.warning(f"Error parsing and routing message: {e}")
-            send(
-                str(e),
-                request_headers=headers,
-                conn=self.conn,
-                send_destination=self.send_destination,
-            )
+            self.conn.send(str(e), request_headers=headers)
+
+
+class ConnectionStateListener(stomp.ConnectionListener):
+    """Keeps track of whether a Connection is connected, so that checking does not
+    require inspecting the underlying socket"""
+
+    def __init__(self, conn: "Connection"):
+        self.conn = conn
+
+    def on_connected(self, headers, body):
+        self.conn._connected = True
+
+    def on_disconnected(self):
+        self.conn._connected = False
+
+    def on_heartbeat_timeout(self):
+        self.conn._connected = False
 
 
 class Connection:
     """Stomp connection wrapper
 
+    By default outgoing frames are not written to the broker by the calling thread.
+    Instead they are placed on a queue which is drained by a sender thread, so that
+    frames sent in quick succession are written back-to-back in batches. Consecutive
+    frames in a batch for the same destination are sent inside a STOMP transaction.
+    Callers that need to know whether a frame was sent can send it with ``wait=True``
+    instead.
+
     Args:
         host:
         port:
@@ -166,6 +199,8 @@ class Connection:
         ssl:
         username:
         password:
+        batch_size: Maximum number of frames written in a single batch
+        flush_interval: Seconds to wait for a batch to fill before writing it
 
     """
 
@@ -178,6 +213,8 @@ class Connection:
         ssl=None,
         username: str = None,
         password: str = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
         **_,
     ):
         self.host = host
@@ -186,10 +223,23 @@ class Connection:
         self.password = password
         self.subscribe_destination = subscribe_destination
         self.send_destination = send_destination
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+        self.flush_interval = (
+            DEFAULT_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        )
+
+        self._connected = False
+        self._send_queue = queue.Queue()
+        # Held while frames are written, so a batch is written back-to-back
+        self._send_lock = threading.Lock()
+        # Held while starting the sender thread
+        self._sender_lock = threading.Lock()
+        self._sender: Optional[threading.Thread] = None
 
         self.conn = stomp.Connection(
             host_and_ports=[(self.host, self.port)], heartbeats=(10000, 0)
         )
+        self.conn.set_listener("state", ConnectionStateListener(self))
 
         if ssl and ssl.get("use_ssl"):
             # It's crazy to me that the default behavior is to NOT VERIFY CERTIFICATES
@@ -215,9 +265,7 @@ class Connection:
             )
 
             if self.subscribe_destination:
-                self.conn.set_listener(
-                    "", OperationListener(self.conn, self.send_destination)
-                )
+                self.conn.set_listener("", OperationListener(self))
 
                 self.conn.subscribe(
                     destination=self.subscribe_destination,
@@ -230,8 +278,11 @@ class Connection:
                     # },
                 )
 
-            # This is probably always True at this point, but just to be safe
-            return self.conn.is_connected()
+            # stomp.py wakes connect() before the listeners have been told about the
+            # connection, so the flag may not have been set yet
+            self._connected = self.conn.is_connected()
+
+            return self._connected
 
         except Exception as ex:
             logger.warning(f"Connection error: {ex}")
@@ -239,16 +290,162 @@ class Connection:
             return False
 
     def disconnect(self):
-        if self.conn.is_connected():
+        self._stop_sender()
+        self.flush()
+
+        if self.is_connected():
             self.conn.disconnect()
 
     def is_connected(self) -> bool:
-        return self.conn.is_connected()
+        # Maintained by the ConnectionStateListener. Until it says we are connected ask
+        # the underlying connection, in case the handshake has finished but the
+        # listener has not been notified yet.
+        return self._connected or self.conn.is_connected()
+
+    def send(self, body, headers=None, request_headers=None, wait: bool = False):
+        """Send a message
+
+        Args:
+            body: The message body
+            headers: Headers to add to the frame
+            request_headers: Headers of the message being replied to, if any
+            wait: Write the frame before returning and raise any error that occurs,
+                rather than queueing it for the sender thread. Frames sent this way are
+                not ordered with respect to frames still waiting in the queue.
 
-    def send(self, body, headers=None):
-        send(
+        Returns:
+            None
+        """
+        message, headers, destination = prepare(
             body,
-            conn=self.conn,
-            send_destination=self.send_destination,
             garden_headers=headers,
+            send_destination=self.send_destination,
+            request_headers=request_headers,
         )
+
+        if not destination:
+            return
+
+        if wait:
+            with self._send_lock:
+                self.conn.send(body=message, headers=headers, destination=destination)
+        else:
+            self._start_sender()
+            self._send_queue.put((message, headers, destination))
+
+    def flush(self):
+        """Write any frames that are waiting to be sent"""
+        while True:
+            try:
+                frame = self._send_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            if frame is not None:
+                self._send_batch(self._drain(frame))
+
+    def _start_sender(self):
+        with self._sender_lock:
+            if self._sender is None or not self._sender.is_alive():
+                self._sender = threading.Thread(
+                    target=self._send_loop, name="StompSender", daemon=True
+                )
+                self._sender.start()
+
+    def _stop_sender(self):
+        if self._sender is not None and self._sender.is_alive():
+            self._send_queue.put(None)
+            self._sender.join(timeout=1)
+
+    def _send_loop(self):
+        while True:
+            frame = self._send_queue.get()
+
+            # None is the signal to stop
+            if frame is None:
+                return
+
+            self._send_batch(self._drain(frame))
+
+    def _drain(self, first_frame: tuple) -> List[tuple]:
+        """Collect up to batch_size frames, waiting at most flush_interval for them"""
+        batch = [first_frame]
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+
+            try:
+                frame = self._send_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+            if frame is None:
+                # Make sure the stop signal is still seen by the sender loop
+                self._send_queue.put(None)
+                break
+
+            batch.append(frame)
+
+        return batch
+
+    def _send_batch(self, batch: List[tuple]):
+        # Hold the lock for the whole batch so the frames are written back-to-back
+        with self._send_lock:
+            if not self.is_connected():
+                logger.warning(f"Not connected, dropping {len(batch)} message(s)")
+                return
+
+            # Consecutive frames for the same destination are sent in a transaction so
+            # the broker handles them as a single unit of work. Frames for different
+            # destinations (replies to different requesters, for example) are kept
+            # apart so that one failure does not take the others with it.
+            for _, group in groupby(batch, key=itemgetter(2)):
+                frames = list(group)
+
+                if len(frames) > 1 and self._send_transaction(frames):
+                    continue
+
+                for message, headers, destination in frames:
+                    self._send_frame(message, headers, destination)
+
+    def _send_frame(self, message: str, headers: dict, destination: str):
+        try:
+            self.conn.send(body=message, headers=headers, destination=destination)
+        except Exception as ex:
+            logger.warning(f"Error sending message to {destination}: {ex}")
+
+    def _send_transaction(self, frames: List[tuple]) -> bool:
+        """Send frames inside a transaction
+
+        Returns:
+            True if the transaction was committed, False if it was aborted (in which
+            case none of the frames were delivered)
+        """
+        transaction = self.conn.begin()
+
+        try:
+            for message, headers, destination in frames:
+                self.conn.send(
+                    body=message,
+                    headers=consolidate_headers(headers, {"transaction": transaction}),
+                    destination=destination,
+                )
+
+            self.conn.commit(transaction=transaction)
+
+            return True
+        except Exception as ex:
+            logger.warning(
+                f"Error sending {len(frames)} message(s) in a transaction, sending "
+                f"them individually: {ex}"
+            )
+
+            try:
+                self.conn.abort(transaction=transaction)
+            except Exception as abort_ex:
+                logger.warning(f"Error aborting transaction: {abort_ex}")
+
+            return False
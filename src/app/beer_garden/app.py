@@ -6,6 +6,7 @@ in Beer-Garden will be initialized within this class.
 """
 import logging
 import signal
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from datetime import timedelta
 from functools import partial
 from multiprocessing.managers import BaseManager
@@ -30,6 +31,7 @@ import beer_garden.local_plugins.manager
 import beer_garden.namespace
 import beer_garden.queue.api as queue
 import beer_garden.router
+import beer_garden.user
 from beer_garden.events.handlers import garden_callbacks
 from beer_garden.events.parent_procesors import HttpParentUpdater
 from beer_garden.events.processors import FanoutProcessor, QueueListener
@@ -131,10 +133,7 @@ class Application(StoppableThread):
 
     def run(self):
         """Before setting up Beer-Garden, ensures that required services are running"""
-        if not self._verify_db_connection():
-            return
-
-        if not self._verify_message_queue_connection():
+        if not self._verify_connections():
             return
 
         self._startup()
@@ -182,6 +181,35 @@ class Application(StoppableThread):
 
         return not self.stopped()
 
+    def _verify_connections(self):
+        """Verify that the application can connect to the database and the message
+        queue. The services are checked at the same time so that a slow service does
+        not hold up checking the others.
+
+        If a verification raises, the application is stopped so that the others give
+        up retrying, and the exception is raised.
+
+        Returns:
+            True: the verifications were successful
+            False: the app was stopped before the connections could be verified
+        """
+        verifications = (
+            self._verify_db_connection,
+            self._verify_message_queue_connection,
+        )
+
+        with ThreadPoolExecutor(max_workers=len(verifications)) as executor:
+            futures = [executor.submit(verification) for verification in verifications]
+
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+
+            for future in done:
+                if future.exception() is not None:
+                    self.stop()
+                    raise future.exception()
+
+        return all([future.result() for future in futures])
+
     def _verify_db_connection(self):
         """Verify that that the application can connect to a database
 
@@ -272,6 +300,7 @@ class Application(StoppableThread):
         self.logger.debug("Publishing shutdown sync")
         beer_garden.command_publishing_blocklist.publish_command_publishing_blocklist()
         beer_garden.garden.publish_garden(status="STOPPED")
+        beer_garden.user.flush_user_events()
 
         if self.scheduler.running:
             self.logger.debug("Pausing scheduler - no more jobs will be run")
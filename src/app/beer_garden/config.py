@@ -911,6 +911,16 @@ _STOMP_SPEC = {
             },
             "default": [],
         },
+        "batch_size": {
+            "type": "int",
+            "default": 10,
+            "description": "Maximum number of messages to write to the broker at once",
+        },
+        "flush_interval": {
+            "type": "float",
+            "default": 0.005,
+            "description": "Seconds to wait for a batch of messages to fill",
+        },
         "ssl": {
             "type": "dict",
             "items": {
@@ -1117,6 +1127,18 @@ _PARENT_SPEC = {
                     },
                     "default": [],
                 },
+                "batch_size": {
+                    "type": "int",
+                    "default": 10,
+                    "description": (
+                        "Maximum number of messages to write to the broker at once"
+                    ),
+                },
+                "flush_interval": {
+                    "type": "float",
+                    "default": 0.005,
+                    "description": "Seconds to wait for a batch of messages to fill",
+                },
                 "ssl": {
                     "type": "dict",
                     "items": {
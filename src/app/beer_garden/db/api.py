@@ -16,6 +16,8 @@ get_job_store = beer_garden.db.mongo.api.get_job_store
 count = beer_garden.db.mongo.api.count
 query_unique = beer_garden.db.mongo.api.query_unique
 query = beer_garden.db.mongo.api.query
+query_unique_async = beer_garden.db.mongo.api.query_unique_async
+query_async = beer_garden.db.mongo.api.query_async
 reload = beer_garden.db.mongo.api.reload
 distinct = beer_garden.db.mongo.api.distinct
 
@@ -9,6 +9,7 @@ from brewtils.schema_parser import SchemaParser
 from mongoengine import (
     ConnectionFailure,
     DoesNotExist,
+    MultipleObjectsReturned,
     NotUniqueError,
     QuerySet,
     connect,
@@ -17,6 +18,7 @@ from mongoengine import (
 from mongoengine.queryset.visitor import Q, QCombination
 
 import beer_garden.db.mongo.models
+import beer_garden.db.mongo.motor as moto
 from beer_garden.db.mongo.models import MongoModel
 from beer_garden.db.mongo.parser import MongoParser
 from beer_garden.db.mongo.pruner import MongoPruner
@@ -64,6 +66,16 @@ for model_name in beer_garden.db.mongo.models.__all__:
     if brewtils_model:
         _model_map[brewtils_model] = mongo_class
 
+# Options of ``query`` that ``query_async`` also supports
+_QUERY_ASYNC_OPTIONS = {
+    "filter_params",
+    "order_by",
+    "include_fields",
+    "exclude_fields",
+    "start",
+    "length",
+}
+
 
 def from_brewtils(obj: ModelItem) -> MongoModel:
     """Convert an item from its Brewtils model to its Mongo one.
@@ -342,6 +354,130 @@ def query(
     return [] if len(query_set) == 0 else to_brewtils(query_set)
 
 
+async def query_unique_async(
+    model_class: ModelType, raise_missing=False, **kwargs
+) -> Optional[ModelItem]:
+    """Query a collection for a unique item without blocking the event loop
+
+    The query is built with mongoengine (so the filtering semantics are identical to
+    ``query_unique``) but is executed with motor. The raw document is then loaded into
+    its Mongo model without another trip to the database.
+
+    Args:
+        model_class: The Brewtils model class to query for
+        raise_missing: If True, raise an exception if an item matching the query is not
+            found. If False, will return None in that case.
+        **kwargs: Arguments to control the query. Equivalent to 'filter_params' from the
+            'query' function.
+
+    Returns:
+        A single Brewtils model
+
+    Raises:
+        mongoengine.DoesNotExist: No matching item exists (only if raise_missing=True)
+        mongoengine.MultipleObjectsReturned: More than one matching item exists
+
+    """
+    mongo_class = _model_map[model_class]
+
+    for k, v in kwargs.items():
+        if isinstance(v, BaseModel):
+            kwargs[k] = from_brewtils(v)
+
+    # Ask for a second document so that a non-unique match can be detected, like get()
+    documents = await moto.query_many(
+        collection=mongo_class._get_collection_name(),
+        filter=mongo_class.objects(**kwargs)._query,
+        limit=2,
+    )
+
+    if not documents:
+        if raise_missing:
+            raise DoesNotExist(f"{mongo_class.__name__} matching query does not exist")
+        return None
+
+    if len(documents) > 1:
+        raise MultipleObjectsReturned("2 or more items returned, instead of 1")
+
+    return to_brewtils(mongo_class._from_son(documents[0]))
+
+
+async def query_async(
+    model_class: ModelType, q_filter: Union[Q, QCombination, None] = None, **kwargs
+) -> List[ModelItem]:
+    """Query a collection without blocking the event loop
+
+    This is the motor-backed counterpart to ``query``. The query is built with
+    mongoengine, so the supported options behave exactly as they do there. Options that
+    only ``query`` supports raise rather than being silently ignored.
+
+    Args:
+        model_class: The Brewtils model class to query for
+        q_filter: Q or QCombination filter to be applied to the QuerySet
+        **kwargs: Arguments to control the query. Valid options are:
+            filter_params: Dict of filtering parameters
+            order_by: Field that will be used to order the result list
+            include_fields: Model fields to include
+            exclude_fields: Model fields to exclude
+            start: Slicing start
+            length: Slicing count
+
+    Returns:
+        A list of Brewtils models
+
+    Raises:
+        ValueError: An option not supported by this function was given
+
+    """
+    unsupported = set(kwargs) - _QUERY_ASYNC_OPTIONS
+    if unsupported:
+        raise ValueError(f"Unsupported query_async options: {sorted(unsupported)}")
+
+    mongo_class = _model_map[model_class]
+    query_set = mongo_class.objects
+
+    if q_filter:
+        query_set = query_set.filter(q_filter)
+
+    if kwargs.get("filter_params"):
+        filter_params = kwargs["filter_params"]
+
+        # If any values are brewtils models those need to be converted
+        for key in filter_params:
+            if isinstance(filter_params[key], BaseModel):
+                filter_params[key] = from_brewtils(filter_params[key])
+
+        query_set = query_set.filter(**filter_params)
+
+    if kwargs.get("order_by"):
+        query_set = query_set.order_by(kwargs.get("order_by"))
+    elif query_set._ordering is None:
+        # Apply the model's default ordering, as the mongoengine cursor would
+        query_set = query_set.order_by(*mongo_class._meta.get("ordering", []))
+
+    if kwargs.get("include_fields"):
+        query_set = query_set.only(*kwargs.get("include_fields"))
+
+    if kwargs.get("exclude_fields"):
+        query_set = query_set.exclude(*kwargs.get("exclude_fields"))
+
+    documents = await moto.query_many(
+        collection=mongo_class._get_collection_name(),
+        filter=query_set._query,
+        projection=query_set._cursor_args.get("projection"),
+        sort=query_set._ordering or None,
+        skip=int(kwargs.get("start") or 0),
+        limit=int(kwargs.get("length") or 0),
+    )
+
+    return to_brewtils(
+        [
+            mongo_class._from_son(document, only_fields=query_set.only_fields)
+            for document in documents
+        ]
+    )
+
+
 def create(obj: ModelItem) -> ModelItem:
     """Save a new item to the database
 
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from typing import Optional
+from typing import List, Optional
 
 from box import Box
 from motor import MotorDatabase
@@ -19,10 +19,8 @@ def create_connection(db_config: Box = None) -> None:
     """
     global motor_db
 
-    motor_conn = MotorClient(
-        host=db_config.connection.host,
-        port=db_config.connection.port,
-    )
+    # Use the whole connection spec (credentials included), same as mongoengine
+    motor_conn = MotorClient(**db_config.connection)
     motor_db = motor_conn[db_config.name]
 
 
@@ -43,6 +41,35 @@ async def query(
     return await motor_db[collection].find_one(filter=filter, projection=projection)
 
 
+async def query_many(
+    collection: str = None,
+    filter: dict = None,
+    projection: dict = None,
+    sort: list = None,
+    skip: int = 0,
+    limit: int = 0,
+) -> List[dict]:
+    """Query for all matching documents
+
+    Args:
+        collection: Name of collection to query
+        filter: Filter parameters
+        projection: Projection parameters
+        sort: List of (key, direction) pairs to sort by
+        skip: Number of documents to skip
+        limit: Maximum number of documents to return (0 for no limit)
+
+    Returns:
+        List of dicts of the find result
+
+    """
+    cursor = motor_db[collection].find(
+        filter=filter, projection=projection, sort=sort, skip=skip, limit=limit
+    )
+
+    return await cursor.to_list(length=None)
+
+
 async def update_one(
     collection: str = None, filter: dict = None, update: dict = None
 ) -> None:
@@ -85,6 +85,8 @@ instance_id_routes: Dict[str, str] = {}
 async_functions = {
     "INSTANCE_UPDATE": beer_garden.plugin.update_async,
     "INSTANCE_HEARTBEAT": beer_garden.plugin.heartbeat_async,
+    "JOB_READ": beer_garden.scheduler.get_job_async,
+    "JOB_READ_ALL": beer_garden.scheduler.get_jobs_async,
 }
 
 # Fake async functions that need to be run in an executor when in an async context.
@@ -702,7 +704,8 @@ def _forward_stomp(operation: Operation, target_garden: Garden) -> None:
         body, model_headers = process(operation)
         headers = consolidate_headers(model_headers, conn_headers)
 
-        conn.send(body=body, headers=headers)
+        # Wait for the frame to be written so that failures are raised here
+        conn.send(body=body, headers=headers, wait=True)
     except Exception as ex:
         raise ForwardException(
             message=(
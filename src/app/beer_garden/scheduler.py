@@ -366,6 +366,14 @@ def get_jobs(filter_params: Optional[Dict] = None, **kwargs) -> List[Job]:
     return db.query(Job, filter_params=filter_params, **kwargs)
 
 
+async def get_job_async(job_id: str) -> Job:
+    return await db.query_unique_async(Job, id=job_id)
+
+
+async def get_jobs_async(filter_params: Optional[Dict] = None, **kwargs) -> List[Job]:
+    return await db.query_async(Job, filter_params=filter_params, **kwargs)
+
+
 @publish_event(Events.JOB_CREATED)
 def create_job(job: Job) -> Job:
     """Create a new Job and add it to the scheduler
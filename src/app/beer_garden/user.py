@@ -1,9 +1,13 @@
 import logging
-from copy import copy
-from typing import List, Optional
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Optional
 
 from brewtils.models import Event, Events, Operation
+from bson import ObjectId
 from marshmallow import ValidationError
+from pymongo import InsertOne, UpdateOne
 
 from beer_garden import config
 from beer_garden.db.mongo.models import Garden, RemoteUser, Role, User
@@ -12,6 +16,33 @@ from beer_garden.role import RoleSyncSchema, role_sync_status, sync_roles
 
 logger = logging.getLogger(__name__)
 
+# Schemas are only ever used for dump / load, so these are built once and shared. They
+# are created by _load_deferred_imports on first use to avoid a circular import, as is
+# the reference to the router module.
+_router = None
+_USER_SYNC_SCHEMA = None
+_USER_SYNC_SCHEMA_MANY = None
+_USER_PATCH_SCHEMA = None
+_ROLE_SYNC_SCHEMA_MANY = RoleSyncSchema(many=True)
+
+# Role assignment scopes that are limited to a namespace, mapped to the domain
+# identifier that holds the namespace name
+_NAMESPACE_IDENTIFIERS = {"Garden": "name", "System": "namespace"}
+
+# A user with its role assignments filtered down to those relevant to a garden. Only
+# carries the fields that UserSyncSchema dumps, so it is much cheaper to create than a
+# copy of the User document.
+_FilteredUser = namedtuple(
+    "_FilteredUser", ["username", "password", "role_assignments"]
+)
+
+# USER_UPDATED events are held for a short time and coalesced by username, so that a
+# burst of updates to the same user results in a single event
+USER_EVENT_FLUSH_DELAY = 0.05
+_pending_user_events: Dict[str, User] = {}
+_pending_user_events_lock = threading.Lock()
+_user_events_timer: Optional[threading.Timer] = None
+
 
 def create_user(**kwargs) -> User:
     """Creates a User using the provided kwargs. The created user is saved to the
@@ -35,7 +66,8 @@ def create_user(**kwargs) -> User:
 
 def update_user(user: User, hashed_password: Optional[str] = None, **kwargs) -> User:
     """Updates the provided User by setting its attributes to those provided by kwargs.
-    The updated user object is then saved to the database and returned.
+    The updated user object is then saved to the database and returned. If none of the
+    attributes actually changed the save is skipped.
 
     Args:
         user: The User instance to be updated
@@ -46,17 +78,14 @@ def update_user(user: User, hashed_password: Optional[str] = None, **kwargs) ->
     Returns:
         User: the updated User instance
     """
-    for key, value in kwargs.items():
-        if key == "password" and hashed_password is None:
-            user.set_password(value)
-        else:
-            setattr(user, key, value)
-
-    if hashed_password:
-        user.password = hashed_password
+    _set_user_fields(user, hashed_password=hashed_password, **kwargs)
 
-    user.save()
-    _publish_user_updated(user)
+    # save() already only sends the changed fields in a $set, but it validates the
+    # entire document first. There is no need for that, or for an event, if nothing
+    # has changed.
+    if user.pk is None or getattr(user, "_changed_fields", []):
+        user.save()
+        _publish_user_updated(user)
 
     return user
 
@@ -68,36 +97,48 @@ def initiate_user_sync() -> None:
     Returns:
         None
     """
-    # Avoiding circular imports
-    from beer_garden.api.http.schemas.v1.user import UserSyncSchema
-    from beer_garden.router import route
+    _load_deferred_imports()
 
-    users = User.objects.all()
-    gardens = Garden.objects.filter(
-        connection_type__nin=["LOCAL", None], status="RUNNING"
+    gardens = list(
+        Garden.objects.filter(connection_type__nin=["LOCAL", None], status="RUNNING")
     )
 
-    for garden in gardens:
-        filtered_users = [
-            _filter_role_assigments_by_garden(user, garden) for user in users
-        ]
-        serialized_users = (
-            UserSyncSchema(many=True, strict=True).dump(filtered_users).data
-        )
+    if not gardens:
+        return
 
-        roles = Role.objects.all()
-        serialized_roles = RoleSyncSchema(many=True).dump(roles).data
+    users = _query_users_for_sync(gardens)
 
-        operation = Operation(
-            operation_type="USER_SYNC",
-            target_garden_name=garden.name,
-            kwargs={
-                "serialized_roles": serialized_roles,
-                "serialized_users": serialized_users,
-            },
+    serialized_roles = _ROLE_SYNC_SCHEMA_MANY.dump(Role.objects.all()).data
+
+    filtered_users_by_garden = _filter_users_by_gardens(users, gardens)
+
+    operations = []
+    for garden in gardens:
+        serialized_users = _USER_SYNC_SCHEMA_MANY.dump(
+            filtered_users_by_garden[garden.name]
+        ).data
+
+        operations.append(
+            Operation(
+                operation_type="USER_SYNC",
+                target_garden_name=garden.name,
+                kwargs={
+                    "serialized_roles": serialized_roles,
+                    "serialized_users": serialized_users,
+                },
+            )
         )
 
-        route(operation)
+    # Routing to a remote garden blocks on the network, so send to all of the gardens
+    # at once rather than one after the other
+    with ThreadPoolExecutor(max_workers=len(operations)) as executor:
+        futures = [
+            executor.submit(_router.route, operation) for operation in operations
+        ]
+
+    # Raise any routing errors now that every garden has been attempted
+    for future in futures:
+        future.result()
 
 
 def user_sync(serialized_roles: List[dict], serialized_users: List[dict]) -> None:
@@ -115,22 +156,27 @@ def user_sync(serialized_roles: List[dict], serialized_users: List[dict]) -> Non
     """
     sync_roles(serialized_roles)
     _import_users(serialized_users)
+    flush_user_events()
     _publish_users_imported()
     initiate_user_sync()
 
 
-def _user_synced_with_garden(user: User, garden: Garden, role_status: dict) -> bool:
+def _user_synced_with_garden(
+    user: User,
+    garden: Garden,
+    role_status: dict,
+    remote_user: Optional[RemoteUser],
+    namespaces: Optional[FrozenSet[str]] = None,
+) -> bool:
     """Checks if the supplied user is currently synced to the supplied garden, based
-    on the corresponding RemoteUser entry.
+    on the corresponding RemoteUser entry (None if there is no such entry). The
+    garden's namespaces can be supplied as a set when checking many users.
     """
-    # Avoiding circular imports
-    from beer_garden.api.http.schemas.v1.user import UserSyncSchema
+    _load_deferred_imports()
 
-    user = _filter_role_assigments_by_garden(user, garden)
+    user = _filter_role_assigments_by_garden(user, garden, namespaces=namespaces)
 
-    try:
-        remote_user = RemoteUser.objects.get(username=user.username, garden=garden.name)
-    except RemoteUser.DoesNotExist:
+    if remote_user is None:
         return len(user.role_assignments) == 0
 
     for role_assignment in user.role_assignments:
@@ -139,11 +185,41 @@ def _user_synced_with_garden(user: User, garden: Garden, role_status: dict) -> b
         if not role_status.get(role_assignment.role.name, {}).get(garden.name, False):
             return False
 
-    role_assignments = UserSyncSchema().dump(user).data["role_assignments"]
+    role_assignments = _USER_SYNC_SCHEMA.dump(user).data["role_assignments"]
 
     return role_assignments == remote_user.role_assignments
 
 
+def _users_synced_with_garden(
+    users: List[User], garden: Garden, role_status: dict
+) -> Dict[str, bool]:
+    """Checks if each of the supplied users is currently synced to the supplied garden.
+    The RemoteUser entries for all of the users are retrieved in a single query.
+
+    Returns:
+        dict: Sync status by username
+    """
+    remote_users = {
+        remote_user.username: remote_user
+        for remote_user in RemoteUser.objects.filter(
+            garden=garden.name, username__in=[user.username for user in users]
+        ).only("username", "role_assignments")
+    }
+
+    namespaces = frozenset(garden.namespaces)
+
+    return {
+        user.username: _user_synced_with_garden(
+            user,
+            garden,
+            role_status,
+            remote_users.get(user.username),
+            namespaces=namespaces,
+        )
+        for user in users
+    }
+
+
 def user_sync_status(users: List[User]) -> dict:
     """Provides the sync status of the provided User with each remote garden. A user is
     considered synced if there is a RemoteUser entry for the specified garden and the
@@ -169,13 +245,10 @@ def user_sync_status(users: List[User]) -> dict:
     user_status = {}
 
     for garden in Garden.objects.filter(connection_type__nin=["LOCAL"]):
-        for user in users:
-            if user.username not in user_status:
-                user_status[user.username] = {}
+        garden_status = _users_synced_with_garden(users, garden, role_status)
 
-            user_status[user.username][garden.name] = _user_synced_with_garden(
-                user, garden, role_status
-            )
+        for username, synced in garden_status.items():
+            user_status.setdefault(username, {})[garden.name] = synced
 
     return user_status
 
@@ -190,30 +263,73 @@ def handle_event(event: Event) -> None:
 
 
 def _import_users(serialized_users: List[dict]) -> None:
-    """Imports users from a list of dictionaries."""
-    # Avoiding circular import. Schemas should probably be moved outside of the http
-    # heirarchy.
-    from beer_garden.api.http.schemas.v1.user import UserPatchSchema
+    """Imports users from a list of dictionaries. All of the resulting inserts and
+    updates are sent to the database in a single bulk write. Existing users that the
+    import does not change are skipped."""
+    _load_deferred_imports()
+
+    updated_user_data_by_username = {}
 
     for serialized_user in serialized_users:
         username = serialized_user["username"]
 
         try:
-            updated_user_data = UserPatchSchema(strict=True).load(serialized_user).data
+            updated_user_data_by_username[username] = _USER_PATCH_SCHEMA.load(
+                serialized_user
+            ).data
+        except ValidationError as exc:
+            logger.info(f"Failed to import user {username} due to error: {exc}")
 
-            try:
-                user = User.objects.get(username=username)
-            except User.DoesNotExist:
-                if len(updated_user_data["role_assignments"]) > 0:
-                    user = User(username=username)
-                    user.save()
-                else:
-                    continue
+    if not updated_user_data_by_username:
+        return
 
-            update_user(user, **updated_user_data)
+    existing_users = {
+        user.username: user
+        for user in User.objects.filter(
+            username__in=list(updated_user_data_by_username)
+        )
+    }
 
-        except ValidationError as exc:
-            logger.info(f"Failed to import user {username} due to error: {exc}")
+    bulk_operations = []
+    imported_users = []
+
+    for username, updated_user_data in updated_user_data_by_username.items():
+        user = existing_users.get(username)
+
+        if user is None:
+            if len(updated_user_data["role_assignments"]) == 0:
+                continue
+
+            user = User(username=username, id=ObjectId())
+            _set_user_fields(user, **updated_user_data)
+            user.validate()
+
+            bulk_operations.append(InsertOne(user.to_mongo().to_dict()))
+        else:
+            _set_user_fields(user, **updated_user_data)
+
+            # As in update_user, a user the sync did not change is neither written nor
+            # published
+            if not getattr(user, "_changed_fields", []):
+                continue
+
+            user.validate()
+
+            # Only send the changed fields, the same way save() would
+            updates, removals = user._delta()
+            update = {"$set": updates}
+            if removals:
+                update["$unset"] = removals
+
+            bulk_operations.append(UpdateOne({"_id": user.id}, update))
+
+        imported_users.append(user)
+
+    if bulk_operations:
+        User._get_collection().bulk_write(bulk_operations, ordered=False)
+
+    for user in imported_users:
+        _publish_user_updated(user)
 
 
 def _handle_user_updated_event(event):
@@ -240,27 +356,152 @@ def _handle_user_updated_event(event):
         logger.error("Error parsing %s event from garden %s", event.name, event.garden)
 
 
-def _filter_role_assigments_by_garden(user, garden) -> User:
+def _set_user_fields(
+    user: User, hashed_password: Optional[str] = None, **kwargs
+) -> None:
+    """Sets the attributes of the provided User to those provided by kwargs, hashing
+    the password if needed. The user is not saved."""
+    for key, value in kwargs.items():
+        if key == "password" and hashed_password is None:
+            user.set_password(value)
+        else:
+            setattr(user, key, value)
+
+    if hashed_password:
+        user.password = hashed_password
+
+
+def _load_deferred_imports() -> None:
+    """Import the modules that would be circular imports at module load and create the
+    shared schema instances, if that has not been done yet"""
+    global _router, _USER_SYNC_SCHEMA, _USER_SYNC_SCHEMA_MANY, _USER_PATCH_SCHEMA
+
+    if _USER_SYNC_SCHEMA is not None:
+        return
+
+    # Avoiding circular import. Schemas should probably be moved outside of the http
+    # heirarchy.
+    import beer_garden.router
+    from beer_garden.api.http.schemas.v1.user import UserPatchSchema, UserSyncSchema
+
+    # The module is kept rather than route itself so that route is still looked up at
+    # call time
+    _router = beer_garden.router
+    _USER_PATCH_SCHEMA = UserPatchSchema(strict=True)
+    _USER_SYNC_SCHEMA_MANY = UserSyncSchema(many=True, strict=True)
+    _USER_SYNC_SCHEMA = UserSyncSchema()
+
+
+def _query_users_for_sync(gardens: List[Garden]) -> List[User]:
+    """Loads every user with only the fields that are part of a sync. Role assignments
+    that do not apply to any of the supplied gardens are filtered out by the database
+    rather than being sent back only to be thrown away."""
+    namespaces = list(
+        {namespace for garden in gardens for namespace in garden.namespaces}
+    )
+
+    assignment_filter = {
+        "$or": [{"$eq": ["$$assignment.domain.scope", "Global"]}]
+        + [
+            {
+                "$and": [
+                    {"$eq": ["$$assignment.domain.scope", scope]},
+                    {
+                        "$in": [
+                            f"$$assignment.domain.identifiers.{identifier}",
+                            namespaces,
+                        ]
+                    },
+                ]
+            }
+            for scope, identifier in _NAMESPACE_IDENTIFIERS.items()
+        ]
+    }
+
+    pipeline = [
+        {
+            "$project": {
+                "username": 1,
+                "password": 1,
+                "role_assignments": {
+                    "$filter": {
+                        "input": {"$ifNull": ["$role_assignments", []]},
+                        "as": "assignment",
+                        "cond": assignment_filter,
+                    }
+                },
+            }
+        }
+    ]
+
+    return [User._from_son(document) for document in User.objects.aggregate(pipeline)]
+
+
+def _filter_role_assigments_by_garden(
+    user, garden, namespaces: Optional[FrozenSet[str]] = None
+) -> _FilteredUser:
     """Filters the role assignments of the supplied user down to those that apply to
-    the namespaces of the supplied garden"""
-    namespaces = garden.namespaces
-    filtered_user = copy(user)
+    the namespaces of the supplied garden. Callers filtering many users for the same
+    garden should build the namespace set once and pass it in."""
+    if namespaces is None:
+        namespaces = frozenset(garden.namespaces)
 
-    filtered_user.role_assignments = [
+    role_assignments = [
         assignment
-        for assignment in filtered_user.role_assignments
-        if (assignment.domain.scope == "Global")
+        for assignment in user.role_assignments
+        if assignment.domain.scope == "Global"
         or (
-            assignment.domain.scope == "Garden"
-            and assignment.domain.identifiers.get("name") in namespaces
-        )
-        or (
-            assignment.domain.scope == "System"
-            and assignment.domain.identifiers.get("namespace") in namespaces
+            assignment.domain.scope in _NAMESPACE_IDENTIFIERS
+            and assignment.domain.identifiers.get(
+                _NAMESPACE_IDENTIFIERS[assignment.domain.scope]
+            )
+            in namespaces
         )
     ]
 
-    return filtered_user
+    return _FilteredUser(user.username, user.password, role_assignments)
+
+
+def _filter_users_by_gardens(
+    users: List[User], gardens: List[Garden]
+) -> Dict[str, List[_FilteredUser]]:
+    """Equivalent to calling _filter_role_assigments_by_garden for every user and
+    garden combination, but each role assignment is only looked at once. Returns the
+    filtered users keyed by garden name."""
+    garden_names = [garden.name for garden in gardens]
+    garden_names_by_namespace = {}
+
+    for garden in gardens:
+        for namespace in frozenset(garden.namespaces):
+            garden_names_by_namespace.setdefault(namespace, []).append(garden.name)
+
+    filtered_users_by_garden = {garden_name: [] for garden_name in garden_names}
+
+    for user in users:
+        assignments_by_garden = {garden_name: [] for garden_name in garden_names}
+
+        for assignment in user.role_assignments:
+            scope = assignment.domain.scope
+
+            if scope == "Global":
+                target_garden_names = garden_names
+            elif scope in _NAMESPACE_IDENTIFIERS:
+                namespace = assignment.domain.identifiers.get(
+                    _NAMESPACE_IDENTIFIERS[scope]
+                )
+                target_garden_names = garden_names_by_namespace.get(namespace, [])
+            else:
+                continue
+
+            for garden_name in target_garden_names:
+                assignments_by_garden[garden_name].append(assignment)
+
+        for garden_name, assignments in assignments_by_garden.items():
+            filtered_users_by_garden[garden_name].append(
+                _FilteredUser(user.username, user.password, assignments)
+            )
+
+    return filtered_users_by_garden
 
 
 def _publish_users_imported():
@@ -275,22 +516,54 @@ def _publish_users_imported():
     )
 
 
+def flush_user_events() -> None:
+    """Publish a USER_UPDATED event for each user with a pending update. This is
+    normally done automatically shortly after the update, but can be called directly
+    when the events need to go out immediately (at shutdown, for instance).
+
+    Returns:
+        None
+    """
+    global _user_events_timer
+
+    with _pending_user_events_lock:
+        users = list(_pending_user_events.values())
+        _pending_user_events.clear()
+
+        if _user_events_timer is not None:
+            _user_events_timer.cancel()
+            _user_events_timer = None
+
+    _load_deferred_imports()
+
+    for user in users:
+        serialized_user = _USER_SYNC_SCHEMA.dump(user).data
+
+        # We use publish rather than publish_event here so that we can hijack the
+        # metadata field to store our actual data. This is done to avoid needing to
+        # deal in brewtils models, which the publish_event decorator requires us to do.
+        publish(
+            Event(
+                name=Events.USER_UPDATED.name,
+                metadata={
+                    "garden": config.get("garden.name"),
+                    "user": serialized_user,
+                },
+            )
+        )
+
+
 def _publish_user_updated(user):
-    """Publish an event with the updated user information"""
-    # Avoiding circular imports
-    from beer_garden.api.http.schemas.v1.user import UserSyncSchema
+    """Queue an event with the updated user information. Only the latest update for
+    each user is published once the pending events are flushed."""
+    global _user_events_timer
 
-    serialized_user = UserSyncSchema().dump(user).data
+    with _pending_user_events_lock:
+        _pending_user_events[user.username] = user
 
-    # We use publish rather than publish_event here so that we can hijack the metadata
-    # field to store our actual data. This is done to avoid needing to deal in brewtils
-    # models, which the publish_event decorator requires us to do.
-    publish(
-        Event(
-            name=Events.USER_UPDATED.name,
-            metadata={
-                "garden": config.get("garden.name"),
-                "user": serialized_user,
-            },
-        )
-    )
+        if _user_events_timer is None:
+            _user_events_timer = threading.Timer(
+                USER_EVENT_FLUSH_DELAY, flush_user_events
+            )
+            _user_events_timer.daemon = True
+            _user_events_timer.start()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import pytest
+from mock import AsyncMock, Mock
+
+import beer_garden.api.http
+import beer_garden.user
+from beer_garden.db.mongo.models import User
+
+
+class TestShutdown(object):
+    @pytest.fixture(autouse=True)
+    def entry_point(self, monkeypatch):
+        monkeypatch.setattr(
+            beer_garden.api.http,
+            "server",
+            Mock(close_all_connections=AsyncMock()),
+            raising=False,
+        )
+        monkeypatch.setattr(beer_garden.api.http, "io_loop", Mock())
+        monkeypatch.setattr(beer_garden.api.http, "logger", Mock())
+        monkeypatch.setattr(beer_garden.api.http, "publish", Mock())
+
+    @pytest.mark.gen_test
+    def test_flushes_user_events(self, monkeypatch):
+        flush_mock = Mock()
+        monkeypatch.setattr(beer_garden.user, "flush_user_events", flush_mock)
+
+        yield beer_garden.api.http.shutdown()
+
+        assert flush_mock.called is True
+        assert beer_garden.api.http.server.close_all_connections.called is True
+
+    @pytest.mark.gen_test
+    def test_publishes_pending_user_events(self, monkeypatch):
+        publish_mock = Mock()
+        monkeypatch.setattr(beer_garden.user, "publish", publish_mock)
+        monkeypatch.setattr(beer_garden.user, "USER_EVENT_FLUSH_DELAY", 60)
+
+        beer_garden.user._publish_user_updated(User(username="pending"))
+
+        yield beer_garden.api.http.shutdown()
+
+        assert publish_mock.call_count == 1
+        assert publish_mock.call_args.args[0].metadata["user"]["username"] == (
+            "pending"
+        )
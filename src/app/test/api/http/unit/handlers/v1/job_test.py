@@ -6,6 +6,7 @@ from brewtils.schema_parser import SchemaParser
 from bson import ObjectId
 from tornado.httpclient import HTTPError, HTTPRequest
 
+import beer_garden.api.http.handlers.v1.job
 from beer_garden.api.http.authentication import issue_token_pair
 from beer_garden.db.mongo.api import MongoParser, from_brewtils
 from beer_garden.db.mongo.models import Garden, Job, Role, RoleAssignment, System, User
@@ -110,6 +111,7 @@ def interval_job(bg_interval_job):
 def drop_jobs():
     yield
     Job.drop_collection()
+    beer_garden.api.http.handlers.v1.job._clear_job_list_cache()
 
 
 class TestJobAPI:
@@ -158,6 +160,24 @@ class TestJobAPI:
 
         assert excinfo.value.code == 403
 
+    @pytest.mark.gen_test
+    def test_get_unknown_job_returns_404(self, base_url, http_client, bad_id):
+        url = f"{base_url}/api/v1/jobs/{bad_id}"
+
+        with pytest.raises(HTTPError) as excinfo:
+            yield http_client.fetch(url)
+
+        assert excinfo.value.code == 404
+
+    @pytest.mark.gen_test
+    def test_get_malformed_job_id_returns_404(self, base_url, http_client):
+        url = f"{base_url}/api/v1/jobs/notanobjectid"
+
+        with pytest.raises(HTTPError) as excinfo:
+            yield http_client.fetch(url)
+
+        assert excinfo.value.code == 404
+
     @pytest.mark.gen_test
     def test_auth_disabled_allows_patch(self, base_url, http_client, job_not_permitted):
         url = f"{base_url}/api/v1/jobs/{job_not_permitted.id}"
@@ -172,6 +192,99 @@ class TestJobAPI:
         assert response.code == 200
         assert Job.objects.get(id=job_not_permitted.id).status == "PAUSED"
 
+    @pytest.mark.gen_test
+    def test_patch_accepts_operations_envelope(
+        self, base_url, http_client, job_not_permitted
+    ):
+        url = f"{base_url}/api/v1/jobs/{job_not_permitted.id}"
+        patch_body = {
+            "operations": [
+                {"operation": "update", "path": "/status", "value": "PAUSED"}
+            ]
+        }
+        headers = {"Content-Type": "application/json"}
+
+        request = HTTPRequest(
+            url, method="PATCH", headers=headers, body=json.dumps(patch_body)
+        )
+        response = yield http_client.fetch(request)
+
+        assert response.code == 200
+        assert Job.objects.get(id=job_not_permitted.id).status == "PAUSED"
+
+    @pytest.mark.gen_test
+    @pytest.mark.parametrize(
+        "values,status", [(["paused"], "PAUSED"), (["PAUSED", "running"], "RUNNING")]
+    )
+    def test_patch_status(
+        self, base_url, http_client, job_not_permitted, values, status
+    ):
+        url = f"{base_url}/api/v1/jobs/{job_not_permitted.id}"
+        patch_body = [
+            {"operation": "update", "path": "/status", "value": value}
+            for value in values
+        ]
+        headers = {"Content-Type": "application/json"}
+
+        request = HTTPRequest(
+            url, method="PATCH", headers=headers, body=json.dumps(patch_body)
+        )
+        response = yield http_client.fetch(request)
+
+        assert response.code == 200
+        assert Job.objects.get(id=job_not_permitted.id).status == status
+
+    @pytest.mark.gen_test
+    def test_patch_rejects_unsupported_status(
+        self, base_url, http_client, job_not_permitted
+    ):
+        url = f"{base_url}/api/v1/jobs/{job_not_permitted.id}"
+        patch_body = {"operation": "update", "path": "/status", "value": "STOPPED"}
+        headers = {"Content-Type": "application/json"}
+
+        request = HTTPRequest(
+            url, method="PATCH", headers=headers, body=json.dumps(patch_body)
+        )
+        with pytest.raises(HTTPError) as excinfo:
+            yield http_client.fetch(request)
+
+        assert excinfo.value.code == 400
+
+    @pytest.mark.gen_test
+    def test_patch_validates_all_operations_first(
+        self, base_url, http_client, job_not_permitted
+    ):
+        url = f"{base_url}/api/v1/jobs/{job_not_permitted.id}"
+        patch_body = [
+            {"operation": "update", "path": "/status", "value": "PAUSED"},
+            {"operation": "update", "path": "/status", "value": "STOPPED"},
+        ]
+        headers = {"Content-Type": "application/json"}
+
+        request = HTTPRequest(
+            url, method="PATCH", headers=headers, body=json.dumps(patch_body)
+        )
+        with pytest.raises(HTTPError) as excinfo:
+            yield http_client.fetch(request)
+
+        assert excinfo.value.code == 400
+        assert Job.objects.get(id=job_not_permitted.id).status == "RUNNING"
+
+    @pytest.mark.gen_test
+    @pytest.mark.parametrize("body", ["not json", '"PAUSED"', '["PAUSED"]', "[]"])
+    def test_patch_rejects_malformed_body(
+        self, base_url, http_client, job_not_permitted, body
+    ):
+        url = f"{base_url}/api/v1/jobs/{job_not_permitted.id}"
+        headers = {"Content-Type": "application/json"}
+
+        request = HTTPRequest(url, method="PATCH", headers=headers, body=body)
+        with pytest.raises(HTTPError) as excinfo:
+            yield http_client.fetch(request)
+
+        assert excinfo.value.code == 400
+        assert Job.objects.get(id=job_not_permitted.id).status == "RUNNING"
+
     @pytest.mark.gen_test
     def test_auth_enabled_allows_patch_for_permitted_job(
         self,
@@ -282,6 +395,120 @@ class TestJobListAPI:
         assert response.code == 200
         assert len(response_body) == 2
 
+    @pytest.mark.gen_test
+    def test_get_no_jobs(self, base_url, http_client):
+        url = f"{base_url}/api/v1/jobs"
+
+        response = yield http_client.fetch(url)
+
+        assert response.code == 200
+        assert json.loads(response.body.decode("utf-8")) == []
+
+    @pytest.mark.gen_test
+    def test_get_filters_by_job_fields(
+        self, base_url, http_client, job_permitted, interval_job
+    ):
+        url = f"{base_url}/api/v1/jobs?trigger_type=interval&not_a_field=foo"
+
+        response = yield http_client.fetch(url)
+        response_body = json.loads(response.body.decode("utf-8"))
+
+        assert response.code == 200
+        assert [job["id"] for job in response_body] == [str(interval_job.id)]
+
+    @pytest.mark.gen_test
+    def test_get_flushes_jobs(
+        self, monkeypatch, base_url, http_client, job_permitted, job_not_permitted
+    ):
+        monkeypatch.setattr(
+            beer_garden.api.http.handlers.v1.job, "JOB_LIST_FLUSH_SIZE", 1
+        )
+        url = f"{base_url}/api/v1/jobs"
+
+        response = yield http_client.fetch(url)
+        response_body = json.loads(response.body.decode("utf-8"))
+
+        assert response.code == 200
+        assert sorted(job["id"] for job in response_body) == sorted(
+            [str(job_permitted.id), str(job_not_permitted.id)]
+        )
+
+    @pytest.mark.gen_test
+    def test_get_serves_cached_response(self, base_url, http_client, job_permitted):
+        url = f"{base_url}/api/v1/jobs"
+
+        first_response = yield http_client.fetch(url)
+        Job.objects.get(id=job_permitted.id).delete()
+        second_response = yield http_client.fetch(url)
+
+        assert second_response.body == first_response.body
+        assert len(json.loads(second_response.body.decode("utf-8"))) == 1
+
+    @pytest.mark.gen_test
+    def test_get_cache_expires(self, monkeypatch, base_url, http_client, job_permitted):
+        monkeypatch.setattr(
+            beer_garden.api.http.handlers.v1.job, "JOB_LIST_CACHE_TTL", 0
+        )
+        url = f"{base_url}/api/v1/jobs"
+
+        yield http_client.fetch(url)
+        Job.objects.get(id=job_permitted.id).delete()
+        response = yield http_client.fetch(url)
+
+        assert json.loads(response.body.decode("utf-8")) == []
+
+    @pytest.mark.gen_test
+    def test_get_cache_cleared_by_patch(self, base_url, http_client, job_permitted):
+        url = f"{base_url}/api/v1/jobs"
+        patch_body = {"operation": "update", "path": "/status", "value": "PAUSED"}
+
+        yield http_client.fetch(url)
+        yield http_client.fetch(
+            HTTPRequest(
+                f"{url}/{job_permitted.id}",
+                method="PATCH",
+                headers={"Content-Type": "application/json"},
+                body=json.dumps(patch_body),
+            )
+        )
+        response = yield http_client.fetch(url)
+
+        assert json.loads(response.body.decode("utf-8"))[0]["status"] == "PAUSED"
+
+    @pytest.mark.gen_test
+    def test_get_not_cached_if_changed_during_get(
+        self, monkeypatch, base_url, http_client, job_permitted
+    ):
+        serialize_job = SchemaParser.serialize_job
+
+        def serialize_during_change(*args, **kwargs):
+            # Simulate a job change completing while the list is being built
+            beer_garden.api.http.handlers.v1.job._clear_job_list_cache()
+
+            return serialize_job(*args, **kwargs)
+
+        monkeypatch.setattr(SchemaParser, "serialize_job", serialize_during_change)
+        url = f"{base_url}/api/v1/jobs"
+
+        response = yield http_client.fetch(url)
+
+        assert len(json.loads(response.body.decode("utf-8"))) == 1
+        assert beer_garden.api.http.handlers.v1.job._job_list_cache == {}
+
+    @pytest.mark.gen_test
+    def test_get_large_response_not_cached(
+        self, monkeypatch, base_url, http_client, job_permitted
+    ):
+        monkeypatch.setattr(
+            beer_garden.api.http.handlers.v1.job, "JOB_LIST_CACHE_MAX_JOBS", 0
+        )
+        url = f"{base_url}/api/v1/jobs"
+
+        response = yield http_client.fetch(url)
+
+        assert len(json.loads(response.body.decode("utf-8"))) == 1
+        assert beer_garden.api.http.handlers.v1.job._job_list_cache == {}
+
     @pytest.mark.gen_test
     def test_auth_enabled_returns_permitted_jobs(
         self,
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+from mock import Mock
+
+from beer_garden.api.stomp.transport import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
+    Connection,
+    ConnectionStateListener,
+)
+
+
+@pytest.fixture
+def connection():
+    conn = Connection(
+        host="localhost", port=61613, send_destination="dest", batch_size=3
+    )
+    conn.conn = Mock()
+    conn.conn.is_connected.return_value = True
+    conn._connected = True
+
+    yield conn
+    conn._stop_sender()
+
+
+class TestConnection(object):
+    def test_send_is_queued(self, connection):
+        connection._start_sender = Mock()
+
+        connection.send("message")
+
+        assert connection._send_queue.qsize() == 1
+        assert connection.conn.send.called is False
+
+    def test_send_wait(self, connection):
+        connection._start_sender = Mock()
+
+        connection.send("message", wait=True)
+
+        assert connection._send_queue.qsize() == 0
+        connection.conn.send.assert_called_once_with(
+            body="message",
+            headers={"model_class": "str", "many": False},
+            destination="dest",
+        )
+
+    def test_send_wait_error(self, connection):
+        connection.conn.send.side_effect = ValueError("broken")
+
+        with pytest.raises(ValueError):
+            connection.send("message", wait=True)
+
+    def test_start_sender_while_sending(self, connection):
+        # Starting the sender must not wait for frames that are being written
+        with connection._send_lock:
+            connection._start_sender()
+
+        assert connection._sender.is_alive()
+
+    def test_default_batching(self):
+        connection = Connection(batch_size=None, flush_interval=None)
+
+        assert connection.batch_size == DEFAULT_BATCH_SIZE
+        assert connection.flush_interval == DEFAULT_FLUSH_INTERVAL
+
+    def test_connect_sets_connected(self, connection):
+        # The listener has not been notified when connect() returns
+        connection._connected = False
+
+        assert connection.connect() is True
+        assert connection._connected is True
+
+    def test_is_connected_falls_back(self, connection):
+        connection._connected = False
+
+        assert connection.is_connected() is True
+
+        connection.conn.is_connected.return_value = False
+        assert connection.is_connected() is False
+
+    def test_send_no_destination(self, connection):
+        connection.send_destination = None
+        connection._start_sender = Mock()
+
+        connection.send("message")
+
+        assert connection._send_queue.qsize() == 0
+
+    def test_send_reply_to(self, connection):
+        connection._start_sender = Mock()
+
+        connection.send("message", request_headers={"reply-to": "reply"})
+
+        assert connection._send_queue.get_nowait()[2] == "reply"
+
+    def test_flush(self, connection):
+        connection._start_sender = Mock()
+
+        for i in range(5):
+            connection.send(f"message{i}")
+        connection.flush()
+
+        sent = [c.kwargs["body"] for c in connection.conn.send.call_args_list]
+        assert sent == [f"message{i}" for i in range(5)]
+
+    def test_flush_not_connected(self, connection):
+        connection._start_sender = Mock()
+        connection._connected = False
+        connection.conn.is_connected.return_value = False
+
+        connection.send("message")
+        connection.flush()
+
+        assert connection.conn.send.called is False
+        assert connection._send_queue.qsize() == 0
+
+    def test_drain_batch_size(self, connection):
+        for i in range(5):
+            connection._send_queue.put((f"message{i}", {}, "dest"))
+
+        batch = connection._drain(connection._send_queue.get())
+
+        assert len(batch) == 3
+        assert connection._send_queue.qsize() == 2
+
+    def test_drain_waits_at_most_flush_interval(self, connection):
+        connection.batch_size = 100
+        connection.flush_interval = 0.05
+        stop = threading.Event()
+
+        def feed():
+            # Keep frames arriving more often than the flush interval
+            while not stop.wait(0.01):
+                connection._send_queue.put(("message", {}, "dest"))
+
+        feeder = threading.Thread(target=feed)
+        feeder.start()
+
+        try:
+            start = time.monotonic()
+            batch = connection._drain(("message", {}, "dest"))
+            elapsed = time.monotonic() - start
+        finally:
+            stop.set()
+            feeder.join()
+
+        assert len(batch) < connection.batch_size
+        assert elapsed < connection.flush_interval * 2
+
+    def test_sender_thread(self, connection):
+        connection.send("message")
+        connection._stop_sender()
+
+        connection.conn.send.assert_called_once_with(
+            body="message",
+            headers={"model_class": "str", "many": False},
+            destination="dest",
+        )
+
+    def test_batch_uses_transaction(self, connection):
+        connection._start_sender = Mock()
+        connection.conn.begin.return_value = "tx1"
+
+        for i in range(2):
+            connection.send(f"message{i}")
+        connection.flush()
+
+        assert all(
+            c.kwargs["headers"]["transaction"] == "tx1"
+            for c in connection.conn.send.call_args_list
+        )
+        connection.conn.commit.assert_called_once_with(transaction="tx1")
+
+    def test_single_frame_no_transaction(self, connection):
+        connection._start_sender = Mock()
+
+        connection.send("message")
+        connection.flush()
+
+        assert connection.conn.begin.called is False
+        assert "transaction" not in connection.conn.send.call_args.kwargs["headers"]
+
+    def test_batch_error_aborts_transaction(self, connection):
+        connection._start_sender = Mock()
+        connection.conn.begin.return_value = "tx1"
+        connection.conn.send.side_effect = ValueError("broken")
+
+        for i in range(2):
+            connection.send(f"message{i}")
+        connection.flush()
+
+        assert connection.conn.commit.called is False
+        connection.conn.abort.assert_called_once_with(transaction="tx1")
+
+    def test_batch_error_resends_individually(self, connection):
+        connection._start_sender = Mock()
+        connection.conn.begin.return_value = "tx1"
+        connection.conn.send.side_effect = [ValueError("broken"), None, None]
+
+        for i in range(2):
+            connection.send(f"message{i}")
+        connection.flush()
+
+        resent = connection.conn.send.call_args_list[1:]
+        assert [c.kwargs["body"] for c in resent] == ["message0", "message1"]
+        assert all("transaction" not in c.kwargs["headers"] for c in resent)
+
+    def test_batch_transaction_per_destination(self, connection):
+        connection._start_sender = Mock()
+        connection.conn.begin.side_effect = ["tx1", "tx2"]
+
+        connection.send("reply0", request_headers={"reply-to": "reply"})
+        connection.send("event0")
+        connection.send("event1")
+        connection.flush()
+
+        headers = {
+            c.kwargs["body"]: c.kwargs["headers"]
+            for c in connection.conn.send.call_args_list
+        }
+        assert "transaction" not in headers["reply0"]
+        assert headers["event0"]["transaction"] == "tx1"
+        assert headers["event1"]["transaction"] == "tx1"
+        connection.conn.commit.assert_called_once_with(transaction="tx1")
+
+    def test_batch_error_isolated_to_frame(self, connection):
+        connection._start_sender = Mock()
+        connection.conn.send.side_effect = [ValueError("broken"), None, None]
+
+        connection.send("reply0", request_headers={"reply-to": "reply0"})
+        connection.send("reply1", request_headers={"reply-to": "reply1"})
+        connection.send("reply2", request_headers={"reply-to": "reply2"})
+        connection.flush()
+
+        assert connection.conn.begin.called is False
+        assert connection.conn.send.call_count == 3
+
+
+class TestConnectionStateListener(object):
+    def test_tracks_connection_state(self):
+        connection = Connection(host="localhost", port=61613)
+        listener = ConnectionStateListener(connection)
+
+        assert connection.is_connected() is False
+
+        listener.on_connected({}, "")
+        assert connection.is_connected() is True
+
+        listener.on_disconnected()
+        assert connection.is_connected() is False
+
+    def test_heartbeat_timeout(self):
+        connection = Connection(host="localhost", port=61613)
+        listener = ConnectionStateListener(connection)
+
+        listener.on_connected({}, "")
+        listener.on_heartbeat_timeout()
+
+        assert connection.is_connected() is False
+
+    def test_registered_on_connection(self):
+        connection = Connection(host="localhost", port=61613)
+
+        listener = connection.conn.get_listener("state")
+
+        assert isinstance(listener, ConnectionStateListener)
+        assert listener.conn is connection
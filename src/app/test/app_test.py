@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import logging
+import threading
 
 import pytest
 import requests.exceptions
@@ -127,6 +128,47 @@ class TestProgressiveBackoff(object):
         assert max_val == 30
 
 
+class TestVerifyConnections(object):
+    def test_verifies_concurrently(self, monkeypatch, app):
+        db_started = threading.Event()
+
+        def verify_db():
+            db_started.set()
+            return True
+
+        monkeypatch.setattr(app, "_verify_db_connection", verify_db)
+        monkeypatch.setattr(
+            app, "_verify_message_queue_connection", lambda: db_started.wait(5)
+        )
+
+        assert app._verify_connections() is True
+
+    def test_failed_verification(self, monkeypatch, app):
+        monkeypatch.setattr(app, "_verify_db_connection", Mock(return_value=False))
+        monkeypatch.setattr(
+            app, "_verify_message_queue_connection", Mock(return_value=True)
+        )
+
+        assert app._verify_connections() is False
+
+    def test_verification_error_stops_other_verifications(self, monkeypatch, app):
+        def verify_mq():
+            # Keep retrying until the application is stopped
+            while not app.wait(0.01):
+                pass
+            return False
+
+        monkeypatch.setattr(
+            app, "_verify_db_connection", Mock(side_effect=ValueError("broken"))
+        )
+        monkeypatch.setattr(app, "_verify_message_queue_connection", verify_mq)
+
+        with pytest.raises(ValueError):
+            app._verify_connections()
+
+        assert app.stopped() is True
+
+
 class TestHelperThread(object):
     @pytest.fixture
     def callable_mock(self):
@@ -3,14 +3,27 @@ import os
 from pathlib import Path
 
 import pytest
+import yaml
 import yapconf
 from mock import Mock, patch
-from ruamel import yaml
 from yapconf import YapconfSpec
 
 import beer_garden.config
 from beer_garden.log import default_app_config
 
+# Use the libyaml implementations if they're available, they're much faster
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def write_yaml(path, data):
+    """Serialize data in memory and write it to path in a single call"""
+    Path(path).write_text(yaml.dump(data, Dumper=YAML_DUMPER, default_flow_style=False))
+
+
+def read_yaml(path):
+    return yaml.load(Path(path).read_text(), Loader=YAML_LOADER)
+
 
 class TestLoadConfig(object):
     def test_no_config_file(self):
@@ -31,8 +44,7 @@ class TestLoadConfig(object):
     def test_config_file(self, tmpdir, extension, contents):
         config_file = Path(tmpdir, f"config.{extension}")
 
-        with open(config_file, "w") as f:
-            f.write(contents)
+        config_file.write_text(contents)
 
         beer_garden.config.load(["-c", str(config_file)], force=True)
         assert beer_garden.config.get("log.fallback_level") == "DEBUG"
@@ -79,8 +91,7 @@ class TestGenerateConfig(object):
         # Ensure that bootstrap items were not written to file
         assert config.configuration.file is None
 
-        with open(config_file) as f:
-            yaml_config = yaml.safe_load(f)
+        yaml_config = read_yaml(config_file)
         assert "configuration" not in yaml_config
 
     def test_create_file(self, tmpdir):
@@ -99,8 +110,7 @@ class TestGenerateConfig(object):
         filename = os.path.join(str(tmpdir), "temp.yaml")
         beer_garden.config.generate(["-c", filename])
 
-        with open(filename) as f:
-            config = yaml.safe_load(f)
+        config = read_yaml(filename)
 
         assert "log" in config
         assert "configuration" not in config
@@ -125,8 +135,7 @@ class TestUpdateConfig(object):
         current_config = os.path.join(str(tmpdir), "config.json")
         new_config = os.path.join(str(tmpdir), "config.yaml")
 
-        with open(current_config, "w") as f:
-            f.write('{"log":{"fallback_level": "DEBUG"}}')
+        Path(current_config).write_text('{"log":{"fallback_level": "DEBUG"}}')
 
         beer_garden.config.migrate(["-c", current_config])
 
@@ -195,9 +204,10 @@ class TestConfigGet(object):
 
 
 class TestSafeMigrate(object):
-    @pytest.fixture
-    def spec(self, monkeypatch):
-        raw_spec = {
+    @pytest.fixture(scope="class")
+    def raw_spec(self):
+        """The specification is never modified, so it is shared by the whole class"""
+        return {
             "log": {
                 "type": "dict",
                 "items": {
@@ -248,8 +258,9 @@ class TestSafeMigrate(object):
                 },
             },
         }
-        # )
 
+    @pytest.fixture
+    def spec(self, monkeypatch, raw_spec):
         monkeypatch.setattr(beer_garden.config, "_SPECIFICATION", raw_spec)
 
         return raw_spec
@@ -264,61 +275,57 @@ class TestSafeMigrate(object):
             "configuration": {"type": "json"},
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def new_config(self):
-        """Represents a up-to-date config with all new values."""
+        """Represents a up-to-date config with all new values. Only ever read, so it is
+        shared by the whole class."""
         return {"log": {"config_file": None, "file": None, "level": "INFO"}}
 
     @pytest.fixture
     def config_file(self, tmpdir):
         return Path(tmpdir, "config.yaml")
 
+    @pytest.fixture
+    def old_config_file(self, config_file, old_config):
+        """Write the un-migrated config to the config file"""
+        write_yaml(config_file, old_config)
+
+        return config_file
+
     def test_success(self, tmpdir, spec, config_file, old_config, new_config):
         old_config["configuration"]["file"] = str(config_file)
 
-        with open(config_file, "w") as f:
-            yaml.safe_dump(
-                old_config, stream=f, default_flow_style=False, encoding="utf-8"
-            )
+        write_yaml(config_file, old_config)
 
         beer_garden.config.load(["-c", str(config_file)], force=True)
         assert beer_garden.config.get("log.level") == "INFO"
 
-        with open(config_file) as f:
-            new_config_value = yaml.safe_load(f)
+        new_config_value = read_yaml(config_file)
 
         assert new_config_value == new_config
         assert len(os.listdir(tmpdir)) == 2
 
     def test_no_change(self, tmpdir, spec, config_file, new_config):
-        with open(config_file, "w") as f:
-            yaml.safe_dump(
-                new_config, stream=f, default_flow_style=False, encoding="utf-8"
-            )
+        write_yaml(config_file, new_config)
 
         beer_garden.config.load(["-c", str(config_file)], force=True)
         assert beer_garden.config.get("log.level") == "INFO"
 
-        with open(config_file) as f:
-            new_config_value = yaml.safe_load(f)
+        new_config_value = read_yaml(config_file)
 
         assert new_config_value == new_config
         assert len(os.listdir(tmpdir)) == 1
 
     def test_migration_failure(
-        self, monkeypatch, caplog, tmpdir, spec, config_file, old_config
+        self, monkeypatch, caplog, tmpdir, spec, old_config_file, old_config
     ):
+        config_file = old_config_file
         monkeypatch.setattr(
             beer_garden.config.YapconfSpec,
             "migrate_config_file",
             Mock(side_effect=ValueError),
         )
 
-        with open(config_file, "w") as f:
-            yaml.safe_dump(
-                old_config, stream=f, default_flow_style=False, encoding="utf-8"
-            )
-
         beer_garden.config.load(["-c", str(config_file)], force=True)
 
         # Make sure we logged something
@@ -326,18 +333,14 @@ class TestSafeMigrate(object):
 
         # If the migration fails, we should still have a single unchanged JSON file.
         assert len(os.listdir(tmpdir)) == 1
-        with open(config_file) as f:
-            new_config_value = yaml.safe_load(f)
+        new_config_value = read_yaml(config_file)
         assert new_config_value == old_config
 
         # And the values should be unchanged
         assert beer_garden.config.get("log.level") == "INFO"
 
-    def test_rename_failure(self, capsys, tmpdir, spec, config_file, old_config):
-        with open(config_file, "w") as f:
-            yaml.safe_dump(
-                old_config, stream=f, default_flow_style=False, encoding="utf-8"
-            )
+    def test_rename_failure(self, capsys, tmpdir, spec, old_config_file, old_config):
+        config_file = old_config_file
 
         with patch("os.rename", Mock(side_effect=ValueError)):
             beer_garden.config.load(["-c", str(config_file)], force=True)
@@ -352,16 +355,12 @@ class TestSafeMigrate(object):
         assert os.path.exists(str(config_file) + ".tmp")
 
         # The loaded config should be the original file.
-        with open(config_file) as f:
-            new_config_value = yaml.safe_load(f)
+        new_config_value = read_yaml(config_file)
 
         assert new_config_value == old_config
 
-    def test_catastrophe(self, capsys, tmpdir, spec, config_file, old_config):
-        with open(config_file, "w") as f:
-            yaml.safe_dump(
-                old_config, stream=f, default_flow_style=False, encoding="utf-8"
-            )
+    def test_catastrophe(self, capsys, tmpdir, spec, old_config_file):
+        config_file = old_config_file
 
         with patch("os.rename", Mock(side_effect=[Mock(), ValueError])):
             with pytest.raises(ValueError):
@@ -3,9 +3,11 @@ import brewtils.test
 import pytest
 from box import Box
 from mongoengine import connect
+from mongoengine.connection import get_db
 
 import beer_garden
 import beer_garden.config as config
+import beer_garden.db.mongo.motor
 import beer_garden.events
 from beer_garden.db.mongo.models import (
     Event,
@@ -30,6 +32,39 @@ def mongo_conn():
     connect("beer_garden", host="mongomock://localhost")
 
 
+@pytest.fixture(scope="module", autouse=True)
+def motor_conn(mongo_conn):
+    """Point the motor helpers at the mongomock database used by mongoengine"""
+
+    class AsyncCursor:
+        def __init__(self, cursor):
+            self.cursor = cursor
+
+        async def to_list(self, length=None):
+            return list(self.cursor)[:length]
+
+    class AsyncCollection:
+        def __init__(self, collection):
+            self.collection = collection
+
+        async def find_one(self, *args, **kwargs):
+            return self.collection.find_one(*args, **kwargs)
+
+        def find(self, *args, **kwargs):
+            return AsyncCursor(self.collection.find(*args, **kwargs))
+
+        async def update_one(self, *args, **kwargs):
+            return self.collection.update_one(*args, **kwargs)
+
+    class AsyncDatabase:
+        def __getitem__(self, name):
+            return AsyncCollection(get_db()[name])
+
+    beer_garden.db.mongo.motor.motor_db = AsyncDatabase()
+    yield
+    beer_garden.db.mongo.motor.motor_db = None
+
+
 @pytest.fixture(scope="module", autouse=True)
 def data_cleanup():
     """Cleanup all data between test modules to ensure each one is independent"""
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 import pytest
 from box import Box
+from brewtils.models import Job as BrewtilsJob
 from mock import Mock
-from mongoengine import ConnectionFailure
+from mongoengine import ConnectionFailure, DoesNotExist, MultipleObjectsReturned
 
 import beer_garden.db.mongo.api
 
@@ -43,3 +44,104 @@ class TestCheckConnection(object):
         monkeypatch.setattr(beer_garden.db.mongo.api, "connect", connect_mock)
 
         assert beer_garden.db.mongo.api.check_connection(db_config) is False
+
+
+class TestQueryAsync(object):
+    @pytest.fixture
+    def job(self, bg_job):
+        bg_job.id = None
+        job = beer_garden.db.mongo.api.from_brewtils(bg_job).save()
+
+        yield job
+        job.delete()
+
+    @pytest.mark.gen_test
+    def test_query_unique_async(self, job):
+        result = yield beer_garden.db.mongo.api.query_unique_async(
+            BrewtilsJob, id=job.id
+        )
+
+        assert isinstance(result, BrewtilsJob)
+        assert result.id == str(job.id)
+        assert result.name == job.name
+
+    @pytest.mark.gen_test
+    def test_query_unique_async_missing(self, bad_id):
+        result = yield beer_garden.db.mongo.api.query_unique_async(
+            BrewtilsJob, id=bad_id
+        )
+
+        assert result is None
+
+    @pytest.mark.gen_test
+    def test_query_unique_async_raise_missing(self, bad_id):
+        with pytest.raises(DoesNotExist):
+            yield beer_garden.db.mongo.api.query_unique_async(
+                BrewtilsJob, raise_missing=True, id=bad_id
+            )
+
+    @pytest.mark.gen_test
+    def test_query_unique_async_multiple(self, jobs):
+        with pytest.raises(MultipleObjectsReturned):
+            yield beer_garden.db.mongo.api.query_unique_async(
+                BrewtilsJob, trigger_type=jobs[0].trigger_type
+            )
+
+    @pytest.mark.gen_test
+    def test_query_async(self, job):
+        result = yield beer_garden.db.mongo.api.query_async(
+            BrewtilsJob, filter_params={"name": job.name}
+        )
+
+        assert len(result) == 1
+        assert result[0].id == str(job.id)
+
+    @pytest.mark.gen_test
+    def test_query_async_no_match(self, job):
+        result = yield beer_garden.db.mongo.api.query_async(
+            BrewtilsJob, filter_params={"name": "not_a_job"}
+        )
+
+        assert result == []
+
+    @pytest.fixture
+    def jobs(self, bg_job):
+        jobs = []
+        for name in ["job_c", "job_a", "job_b"]:
+            bg_job.id = None
+            bg_job.name = name
+            jobs.append(beer_garden.db.mongo.api.from_brewtils(bg_job).save())
+
+        yield jobs
+        for job in jobs:
+            job.delete()
+
+    @pytest.mark.gen_test
+    def test_query_async_options(self, jobs):
+        result = yield beer_garden.db.mongo.api.query_async(
+            BrewtilsJob,
+            order_by="name",
+            include_fields=["name"],
+            start=1,
+            length=1,
+        )
+
+        assert len(result) == 1
+        assert result[0].name == "job_b"
+        assert result[0].trigger_type is None
+
+        # The same options must give the same result as the blocking query
+        assert result[0].__dict__ == (
+            beer_garden.db.mongo.api.query(
+                BrewtilsJob,
+                order_by="name",
+                include_fields=["name"],
+                start=1,
+                length=1,
+            )[0].__dict__
+        )
+
+    @pytest.mark.gen_test
+    def test_query_async_unsupported_option(self):
+        with pytest.raises(ValueError):
+            yield beer_garden.db.mongo.api.query_async(BrewtilsJob, text_search="job")
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from box import Box
+from mock import MagicMock
+
+import beer_garden.db.mongo.motor
+
+
+class TestCreateConnection(object):
+    def test_uses_connection_config(self, monkeypatch):
+        db_config = Box(
+            {
+                "name": "db_name",
+                "connection": {
+                    "username": "db_username",
+                    "password": "db_password",
+                    "host": "db_host",
+                    "port": 27017,
+                },
+            }
+        )
+        client_mock = MagicMock()
+        monkeypatch.setattr(beer_garden.db.mongo.motor, "MotorClient", client_mock)
+        monkeypatch.setattr(beer_garden.db.mongo.motor, "motor_db", None)
+
+        beer_garden.db.mongo.motor.create_connection(db_config=db_config)
+
+        client_mock.assert_called_once_with(
+            username="db_username",
+            password="db_password",
+            host="db_host",
+            port=27017,
+        )
+        client_mock.return_value.__getitem__.assert_called_once_with("db_name")
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import pytest
+from mock import Mock
+
+import beer_garden
+
+
+class TestSignalHandler(object):
+    @pytest.fixture(autouse=True)
+    def exit_mock(self, monkeypatch):
+        exit_mock = Mock()
+        monkeypatch.setattr(beer_garden.os, "_exit", exit_mock)
+
+        return exit_mock
+
+    @pytest.fixture
+    def application(self, monkeypatch):
+        application = Mock()
+        monkeypatch.setattr(beer_garden, "application", application)
+
+        return application
+
+    def test_first_signal_stops(self, application, exit_mock):
+        application.stopped.return_value = False
+
+        beer_garden.signal_handler(None, None)
+
+        assert application.stop.called is True
+        assert exit_mock.called is False
+
+    def test_second_signal_exits(self, application, exit_mock):
+        application.stopped.return_value = True
+
+        beer_garden.signal_handler(None, None)
+
+        exit_mock.assert_called_once_with(1)
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from mock import Mock
+
+import beer_garden
+import beer_garden.__main__
+
+
+class TestMain(object):
+    def test_joins_until_application_stops(self, monkeypatch):
+        application = Mock()
+        application.is_alive.side_effect = [True, True, False]
+
+        monkeypatch.setattr(beer_garden, "application", None)
+        monkeypatch.setattr(beer_garden.__main__.sys, "argv", ["beergarden"])
+        monkeypatch.setattr(beer_garden.config, "load", Mock())
+        monkeypatch.setattr(beer_garden.config, "get", Mock())
+        monkeypatch.setattr(beer_garden.log, "load", Mock())
+        monkeypatch.setattr(
+            beer_garden.__main__, "Application", Mock(return_value=application)
+        )
+        monkeypatch.setattr(beer_garden.__main__.signal, "signal", Mock())
+        monkeypatch.setattr(beer_garden.__main__.signal, "pause", Mock())
+
+        beer_garden.__main__.main()
+
+        assert application.start.called is True
+        assert application.join.call_count == 2
+        application.join.assert_called_with(
+            timeout=beer_garden.__main__.SHUTDOWN_JOIN_INTERVAL
+        )
@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 import pytest
-from brewtils.models import Operation
+from brewtils.models import Garden, Operation
 from mock import Mock
 
 import beer_garden.garden
 import beer_garden.router
-from beer_garden.errors import UnknownGardenException
-from beer_garden.router import _determine_target
+from beer_garden.errors import ForwardException, UnknownGardenException
+from beer_garden.router import _determine_target, _forward_stomp
 
 
 @pytest.fixture
@@ -52,3 +52,29 @@ class TestDetermineTarget:
         op.target_garden_name = "parent"
 
         assert _determine_target(op) == "child"
+
+
+class TestForwardStomp:
+    @pytest.fixture
+    def garden(self):
+        return Garden(name="child", connection_params={"stomp": {"headers": []}})
+
+    @pytest.fixture
+    def conn(self, monkeypatch, garden):
+        conn = Mock()
+        monkeypatch.setattr(
+            beer_garden.router, "stomp_garden_connections", {garden.name: conn}
+        )
+
+        return conn
+
+    def test_send_waits(self, op, garden, conn):
+        _forward_stomp(op, garden)
+
+        assert conn.send.call_args.kwargs["wait"] is True
+
+    def test_send_error(self, op, garden, conn):
+        conn.send.side_effect = ValueError("broken")
+
+        with pytest.raises(ForwardException):
+            _forward_stomp(op, garden)
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
+import threading
+
 import pytest
 from brewtils.models import Event, Events
-from mock import Mock
+from mock import Mock, patch
 from mongoengine import connect
 
 import beer_garden.events
@@ -19,6 +21,7 @@ from beer_garden.db.mongo.models import (
 from beer_garden.role import RoleSyncSchema
 from beer_garden.user import (
     create_user,
+    flush_user_events,
     handle_event,
     initiate_user_sync,
     update_user,
@@ -37,6 +40,14 @@ class TestUser:
         yield
         User.drop_collection()
 
+    @pytest.fixture(autouse=True)
+    def pending_user_events(self):
+        with patch.object(beer_garden.user, "publish"):
+            flush_user_events()
+        yield
+        with patch.object(beer_garden.user, "publish"):
+            flush_user_events()
+
     @pytest.fixture
     def garden(self):
         _garden = Garden(name="garden", connection_type="HTTP", status="RUNNING").save()
@@ -131,6 +142,57 @@ class TestUser:
         assert updated_user.password != prev_password
         assert updated_user.password != "badpassword"
 
+    def test_update_user_without_changes_is_not_saved(self, monkeypatch, user_role):
+        monkeypatch.setattr(beer_garden.user, "publish", Mock())
+        user = User(
+            username="testuser",
+            role_assignments=[
+                RoleAssignment(role=user_role, domain={"scope": "Global"})
+            ],
+        ).save()
+        user = User.objects.get(id=user.id)
+        monkeypatch.setattr(user, "save", Mock())
+
+        update_user(
+            user,
+            username="testuser",
+            role_assignments=[
+                RoleAssignment(role=user_role, domain={"scope": "Global"})
+            ],
+        )
+        flush_user_events()
+
+        assert user.save.called is False
+        assert beer_garden.user.publish.called is False
+
+    def test_update_user_events_are_coalesced(self, monkeypatch):
+        monkeypatch.setattr(beer_garden.user, "publish", Mock())
+        monkeypatch.setattr(beer_garden.user, "USER_EVENT_FLUSH_DELAY", 60)
+        user = User(username="testuser").save()
+
+        update_user(user, password="password1")
+        update_user(user, password="password2")
+        assert beer_garden.user.publish.called is False
+
+        flush_user_events()
+        assert beer_garden.user.publish.call_count == 1
+
+        event = beer_garden.user.publish.call_args.args[0]
+        assert event.name == Events.USER_UPDATED.name
+        assert event.metadata["user"]["username"] == user.username
+
+    def test_update_user_events_are_flushed_automatically(self, monkeypatch):
+        published = threading.Event()
+        monkeypatch.setattr(
+            beer_garden.user, "publish", Mock(side_effect=lambda _: published.set())
+        )
+        user = User(username="testuser").save()
+
+        update_user(user, password="password")
+
+        assert published.wait(timeout=5) is True
+        assert beer_garden.user.publish.call_count == 1
+
     def test_initiate_user_sync_routes_to_each_running_garden(
         self, monkeypatch, gardens
     ):
@@ -142,6 +204,117 @@ class TestUser:
             Garden.objects.filter(status="RUNNING")
         )
 
+    def test_initiate_user_sync_sends_synced_fields(
+        self, monkeypatch, gardens, user_role
+    ):
+        monkeypatch.setattr(beer_garden.router, "route", Mock())
+        user = User(
+            username="testuser",
+            role_assignments=[
+                RoleAssignment(role=user_role, domain={"scope": "Global"})
+            ],
+        )
+        user.set_password("password")
+        user.save()
+
+        initiate_user_sync()
+
+        operation = beer_garden.router.route.call_args.args[0]
+        serialized_user = operation.kwargs["serialized_users"][0]
+
+        assert serialized_user["username"] == "testuser"
+        assert serialized_user["hashed_password"] == user.password
+        assert serialized_user["role_assignments"][0]["role_name"] == user_role.name
+
+    def test_initiate_user_sync_routes_to_all_gardens_before_raising(
+        self, monkeypatch, gardens
+    ):
+        monkeypatch.setattr(
+            beer_garden.router, "route", Mock(side_effect=ValueError("unreachable"))
+        )
+        User(username="testuser").save()
+
+        with pytest.raises(ValueError):
+            initiate_user_sync()
+
+        targets = [
+            call.args[0].target_garden_name
+            for call in beer_garden.router.route.call_args_list
+        ]
+        assert sorted(targets) == sorted(
+            garden.name for garden in Garden.objects.filter(status="RUNNING")
+        )
+
+    def test_query_users_for_sync_drops_unrelated_assignments(self, user_role):
+        gardens = [
+            Garden(name="garden1", namespaces=["ns1"]),
+            Garden(name="garden2", namespaces=["ns2"]),
+        ]
+        domains = [
+            {"scope": "Global"},
+            {"scope": "Garden", "identifiers": {"name": "ns1"}},
+            {"scope": "Garden", "identifiers": {"name": "ns3"}},
+            {"scope": "System", "identifiers": {"name": "sys", "namespace": "ns2"}},
+            {"scope": "System", "identifiers": {"name": "sys", "namespace": "ns3"}},
+        ]
+        User(
+            username="testuser",
+            role_assignments=[
+                RoleAssignment(role=user_role, domain=domain) for domain in domains
+            ],
+        ).save()
+        User(username="otheruser").save()
+
+        users = {
+            user.username: user
+            for user in beer_garden.user._query_users_for_sync(gardens)
+        }
+
+        assert [
+            (assignment.domain.scope, assignment.domain.identifiers)
+            for assignment in users["testuser"].role_assignments
+        ] == [
+            ("Global", {}),
+            ("Garden", {"name": "ns1"}),
+            ("System", domains[3]["identifiers"]),
+        ]
+        assert users["testuser"].role_assignments[0].role == user_role
+        assert users["otheruser"].role_assignments == []
+
+    def test_filter_users_by_gardens_matches_per_garden_filter(self, user_role):
+        gardens = [
+            Garden(name="garden1", namespaces=["ns1", "ns2"]),
+            Garden(name="garden2", namespaces=["ns2"]),
+            Garden(name="garden3", namespaces=[]),
+        ]
+        domains = [
+            {"scope": "Global"},
+            {"scope": "Garden", "identifiers": {"name": "ns1"}},
+            {"scope": "Garden", "identifiers": {"name": "ns3"}},
+            {"scope": "System", "identifiers": {"name": "sys", "namespace": "ns2"}},
+            {"scope": "Unknown", "identifiers": {"name": "ns1"}},
+        ]
+        user = User(
+            username="testuser",
+            role_assignments=[
+                RoleAssignment(role=user_role, domain=domain) for domain in domains
+            ],
+        )
+
+        filtered = beer_garden.user._filter_users_by_gardens([user], gardens)
+
+        for garden in gardens:
+            expected = beer_garden.user._filter_role_assigments_by_garden(user, garden)
+            assert len(filtered[garden.name]) == 1
+            assert (
+                filtered[garden.name][0].role_assignments == expected.role_assignments
+            )
+
+        assert len(filtered["garden1"][0].role_assignments) == 3
+        assert len(filtered["garden2"][0].role_assignments) == 2
+        assert len(filtered["garden3"][0].role_assignments) == 1
+        assert len(user.role_assignments) == len(domains)
+
     def test_user_sync_creates_user(self, monkeypatch, user_to_sync, serialized_role):
         monkeypatch.setattr(beer_garden.user, "initiate_user_sync", Mock())
         monkeypatch.setattr(beer_garden.user, "publish", Mock())
@@ -165,6 +338,41 @@ class TestUser:
         user_to_sync.reload()
         assert len(user_to_sync.role_assignments) == 1
 
+    def test_user_sync_imports_users_in_one_bulk_write(
+        self, mocker, monkeypatch, user_to_sync, serialized_role
+    ):
+        monkeypatch.setattr(beer_garden.user, "initiate_user_sync", Mock())
+        monkeypatch.setattr(beer_garden.user, "publish", Mock())
+        bulk_write_spy = mocker.spy(type(User._get_collection()), "bulk_write")
+
+        existing_user = User(username="existing").save()
+        new_user_data = UserSyncSchema().dump(user_to_sync).data
+        existing_user_data = dict(new_user_data, username=existing_user.username)
+
+        user_sync([serialized_role], [new_user_data, existing_user_data])
+
+        assert bulk_write_spy.call_count == 1
+        assert len(bulk_write_spy.call_args.args[1]) == 2
+        assert len(User.objects.get(username="existing").role_assignments) == 1
+        assert len(User.objects.get(username=user_to_sync.username).role_assignments)
+        assert beer_garden.user.publish.call_count == 3
+
+    def test_user_sync_skips_unchanged_users(
+        self, mocker, monkeypatch, user_to_sync, serialized_role
+    ):
+        monkeypatch.setattr(beer_garden.user, "initiate_user_sync", Mock())
+        monkeypatch.setattr(beer_garden.user, "publish", Mock())
+        user_to_sync.save()
+        serialized_user = UserSyncSchema().dump(user_to_sync).data
+        bulk_write_spy = mocker.spy(type(User._get_collection()), "bulk_write")
+
+        user_sync([serialized_role], [serialized_user])
+
+        assert bulk_write_spy.called is False
+        assert [c.args[0].name for c in beer_garden.user.publish.call_args_list] == [
+            "USERS_IMPORTED"
+        ]
+
     def test_user_sync_status_returns_false_for_no_remote_user(
         self, user_to_sync, garden
     ):
@@ -195,6 +403,39 @@ class TestUser:
         user_status = user_sync_status([user])[user.username]
         assert user_status[garden.name] is True
 
+    def test_user_sync_status_queries_remote_users_once_per_garden(
+        self, monkeypatch, user_to_sync, remote_user, garden
+    ):
+        filter_spy = Mock(wraps=RemoteUser.objects.filter)
+        monkeypatch.setattr(RemoteUser, "objects", Mock(filter=filter_spy))
+        other_user = User(username="otheruser")
+
+        user_status = user_sync_status([user_to_sync, other_user])
+
+        assert filter_spy.call_count == len(
+            Garden.objects.filter(connection_type="HTTP")
+        )
+        assert user_status[user_to_sync.username][remote_user.garden] is True
+        assert user_status[user_to_sync.username][garden.name] is False
+        assert user_status[other_user.username][garden.name] is True
+
+    def test_user_sync_status_builds_namespaces_once_per_garden(
+        self, mocker, user_to_sync, remote_user, garden
+    ):
+        filter_spy = mocker.spy(beer_garden.user, "_filter_role_assigments_by_garden")
+        other_user = User(username="otheruser")
+
+        user_sync_status([user_to_sync, other_user])
+
+        namespaces_by_garden = {}
+        for call in filter_spy.call_args_list:
+            namespaces_by_garden.setdefault(call.args[1].name, set()).add(
+                id(call.kwargs["namespaces"])
+            )
+
+        assert namespaces_by_garden
+        assert all(len(ids) == 1 for ids in namespaces_by_garden.values())
+
     def test_user_sync_status_returns_false_for_out_of_sync_roles(
         self, user_to_sync, remote_user, garden_with_role
     ):